@@ -0,0 +1,28 @@
+"""add_empty_job_id_partial_index
+
+Revision ID: 2e8d4f6a9b1c
+Revises: 7c3e91a5b2d8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8d4f6a9b1c'
+down_revision: Union[str, Sequence[str], None] = '7c3e91a5b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_job_empty_job_id', 'jobs', ['id'],
+                    sqlite_where=sa.text("job_id = ''"),
+                    postgresql_where=sa.text("job_id = ''"))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_job_empty_job_id', table_name='jobs')
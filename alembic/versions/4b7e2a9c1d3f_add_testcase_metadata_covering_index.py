@@ -0,0 +1,27 @@
+"""add_testcase_metadata_covering_index
+
+Revision ID: 4b7e2a9c1d3f
+Revises: 9d2f6734f71b
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2a9c1d3f'
+down_revision: Union[str, Sequence[str], None] = '9d2f6734f71b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_testcase_name_priority_topology', 'testcase_metadata',
+                    ['testcase_name', 'priority', 'topology'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_testcase_name_priority_topology', table_name='testcase_metadata')
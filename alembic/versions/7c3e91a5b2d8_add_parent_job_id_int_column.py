@@ -0,0 +1,35 @@
+"""add_parent_job_id_int_column
+
+Revision ID: 7c3e91a5b2d8
+Revises: 4b7e2a9c1d3f
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e91a5b2d8'
+down_revision: Union[str, Sequence[str], None] = '4b7e2a9c1d3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite can only ADD a VIRTUAL generated column; PostgreSQL (before 18)
+    # only supports STORED ones, and only STORED ones can be indexed there.
+    # The CAST is an expression so MySQL gets its own SIGNED INTEGER form
+    persisted = op.get_context().dialect.name != 'sqlite'
+    op.add_column('jobs', sa.Column(
+        'parent_job_id_int', sa.Integer(),
+        sa.Computed(sa.cast(sa.func.nullif(sa.column('parent_job_id'), ''), sa.Integer), persisted=persisted)
+    ))
+    op.create_index('idx_module_parent_job_int', 'jobs', ['module_id', 'parent_job_id_int'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_module_parent_job_int', table_name='jobs')
+    op.drop_column('jobs', 'parent_job_id_int')
@@ -6,7 +6,8 @@ dependency injection for FastAPI endpoints.
 """
 from contextlib import contextmanager
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.config import get_settings
 
@@ -22,6 +23,11 @@ if "postgresql" in settings.DATABASE_URL or "mysql" in settings.DATABASE_URL:
         'pool_pre_ping': True,         # Verify connections before using them
         'pool_recycle': 3600,          # Recycle connections after 1 hour
     }
+    if make_url(settings.DATABASE_URL).get_driver_name() == 'psycopg2':
+        # Batch executemany UPDATE/DELETEs with execute_batch() as well as
+        # sending INSERTs as multi-row VALUES (the psycopg2 default)
+        pool_config['executemany_mode'] = 'values_plus_batch'
+        pool_config['executemany_batch_page_size'] = 1000
 elif "sqlite" in settings.DATABASE_URL:
     # SQLite doesn't benefit from pooling but needs thread safety
     pool_config = {
@@ -43,10 +49,18 @@ engine = create_engine(
     **pool_config
 )
 
-if "sqlite" in settings.DATABASE_URL:
-    from sqlalchemy import event
-    
-    @event.listens_for(engine, "connect")
+
+def configure_sqlite_pragmas(sqlite_engine: Engine) -> None:
+    """
+    Apply the app's SQLite PRAGMA tuning to every new connection of an engine.
+
+    Also used by the maintenance scripts in scripts/ so bulk backfills get
+    the same WAL / synchronous=NORMAL settings as the web app.
+
+    Args:
+        sqlite_engine: Engine bound to a SQLite database
+    """
+    @event.listens_for(sqlite_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         # Use Write-Ahead Logging for better concurrency
         cursor = dbapi_connection.cursor()
@@ -57,6 +71,10 @@ if "sqlite" in settings.DATABASE_URL:
         cursor.execute("PRAGMA temp_store=MEMORY")     # temp tables in RAM
         cursor.close()
 
+
+if "sqlite" in settings.DATABASE_URL:
+    configure_sqlite_pragmas(engine)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -6,7 +6,7 @@ job summaries, and configuration settings.
 """
 from datetime import datetime, timezone
 import enum
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, Enum as SQLEnum, Index, Computed, cast, func, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -83,6 +83,10 @@ class Job(Base):
     module_id = Column(Integer, ForeignKey("modules.id", ondelete="CASCADE"), nullable=False)
     job_id = Column(String(20), nullable=False)  # Jenkins job number (e.g., "123")
     parent_job_id = Column(String(20))  # Parent Jenkins job that spawned this module job
+    # Integer view of parent_job_id (NULL when unset or empty) for max/range queries without a per-row CAST.
+    # Built as an expression so each dialect renders its own CAST (SIGNED INTEGER on MySQL); STORED so
+    # PostgreSQL accepts and can index it. Migrated SQLite databases hold it as VIRTUAL (see 7c3e91a5b2d8)
+    parent_job_id_int = Column(Integer, Computed(cast(func.nullif(parent_job_id, ''), Integer), persisted=True))
 
     # Summary statistics (denormalized for performance)
     total = Column(Integer, default=0)
@@ -108,6 +112,9 @@ class Job(Base):
         Index('idx_module_job', 'module_id', 'job_id', unique=True),
         Index('idx_job_created', 'created_at'),  # For ordering
         Index('idx_job_environment', 'environment'),
+        Index('idx_module_parent_job_int', 'module_id', 'parent_job_id_int'),  # For max parent build per module
+        # Partial index holding only jobs with an empty job_id, so the validation check reads no other rows
+        Index('idx_job_empty_job_id', 'id', sqlite_where=text("job_id = ''"), postgresql_where=text("job_id = ''")),
     )
 
     def __repr__(self):
@@ -213,6 +220,7 @@ class TestcaseMetadata(Base):
         Index('idx_test_state_meta', 'test_state'),            # NEW
         Index('idx_release_testcase', 'release_id', 'testcase_name'),  # Composite index for release-specific queries
         Index('idx_is_removed', 'is_removed'),                 # For filtering removed tests
+        Index('idx_testcase_name_priority_topology', 'testcase_name', 'priority', 'topology'),  # Covering index for backfill lookups
     )
 
     def __repr__(self):
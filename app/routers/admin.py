@@ -18,7 +18,7 @@ from pydantic import BaseModel, HttpUrl, field_validator, ConfigDict
 from sqlalchemy.orm import Session
 import re
 
-from sqlalchemy import func, cast, Integer
+from sqlalchemy import func
 
 from app.database import get_db
 from app.models.db_models import Release, Module, AppSettings, Job, MetadataSyncLog
@@ -809,16 +809,14 @@ async def sync_last_processed_builds(request: Request, db: Session = Depends(get
 
     for release in releases:
         # Query max parent_job_id for this release
-        # parent_job_id is stored as String, so we need to cast to Integer
-        # Filter out NULL and empty values before casting to prevent errors
+        # parent_job_id_int is the generated integer view of parent_job_id;
+        # NULL/empty parent ids are NULL there and ignored by MAX
         max_parent_job = db.query(
-            func.max(cast(Job.parent_job_id, Integer))
+            func.max(Job.parent_job_id_int)
         ).join(
             Module
         ).filter(
-            Module.release_id == release.id,
-            Job.parent_job_id.isnot(None),
-            Job.parent_job_id != ''
+            Module.release_id == release.id
         ).scalar()
 
         old_value = release.last_processed_build or 0
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 from collections import defaultdict
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, contains_eager
 from sqlalchemy import func, desc, case, Integer, nullslast, select
 
 from app.models.db_models import (
@@ -1649,12 +1649,15 @@ def get_jobs_by_parent_job_id(
 
     Returns:
         List of Job objects from all modules with this parent_job_id
+        (job.module is populated from the same query)
     """
     release = get_release_by_name(db, release_name)
     if not release:
         return []
 
-    query = db.query(Job).join(Module).filter(
+    query = db.query(Job).join(Module).options(
+        contains_eager(Job.module)
+    ).filter(
         Module.release_id == release.id,
         Job.parent_job_id == parent_job_id
     )
@@ -1780,6 +1783,60 @@ def get_aggregated_stats_for_parent_job(
     return _aggregate_jobs_for_parent(jobs, parent_job_id, jenkins_job_url)
 
 
+def describe_parent_job(
+    db: Session,
+    release_name: str,
+    parent_job_id: str,
+    environment: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get the parent job URL, aggregated stats and module jobs for a parent_job_id.
+
+    Combines get_parent_job_url, get_aggregated_stats_for_parent_job and
+    get_jobs_by_parent_job_id, loading the release and the jobs once
+    instead of once per call.
+
+    Args:
+        db: Database session
+        release_name: Release name
+        parent_job_id: Parent job ID (must not be None)
+        environment: Optional environment filter ('prod' or 'staging')
+
+    Returns:
+        Dict with:
+        {
+            'parent_job_url': Optional[str],
+            'stats': Dict[str, Any],  # As returned by get_aggregated_stats_for_parent_job
+            'jobs': List[Job]  # As returned by get_jobs_by_parent_job_id
+        }
+    """
+    # Validate parent_job_id is not None
+    if not parent_job_id:
+        raise ValueError("parent_job_id cannot be None or empty")
+
+    release = get_release_by_name(db, release_name)
+    jenkins_job_url = release.jenkins_job_url if release else None
+
+    jobs = []
+    if release:
+        query = db.query(Job).join(Module).options(
+            contains_eager(Job.module)
+        ).filter(
+            Module.release_id == release.id,
+            Job.parent_job_id == parent_job_id
+        )
+        query = _apply_environment_filter(query, environment)
+        jobs = query.all()
+
+    stats = _aggregate_jobs_for_parent(jobs, parent_job_id, jenkins_job_url)
+
+    return {
+        'parent_job_url': stats['parent_job_url'],
+        'stats': stats,
+        'jobs': jobs
+    }
+
+
 def get_module_breakdown_for_parent_job(
     db: Session,
     release_name: str,
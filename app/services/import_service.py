@@ -3,6 +3,7 @@ Import service for converting parsed logs into database records.
 Bridges the bundled parser with SQLAlchemy database models.
 """
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
@@ -26,6 +27,9 @@ from app.models.db_models import (
 from app.utils.testcase_helpers import extract_module_from_path
 from app.utils.test_name_utils import normalize_test_name
 
+# Pending test results after which bulk log imports commit and clear the session
+IMPORT_COMMIT_BATCH_SIZE = 1000
+
 
 def convert_test_status(parsed_status: ParsedTestStatus) -> TestStatusEnum:
     """Convert parsed TestStatus to database TestStatusEnum.
@@ -60,11 +64,14 @@ def calculate_job_statistics(test_results: List[ParsedTestResult]) -> Dict[str,
         - Skipped tests are excluded from the denominator as they weren't executed
         - ERROR status is counted as FAILED for consistency
     """
+    # Tally statuses in one pass over the results
+    status_counts = Counter(r.status for r in test_results)
+
     total = len(test_results)
-    passed = sum(1 for r in test_results if r.status == ParsedTestStatus.PASSED)
+    passed = status_counts[ParsedTestStatus.PASSED]
     # Count both FAILED and ERROR as failed
-    failed = sum(1 for r in test_results if r.status in (ParsedTestStatus.FAILED, ParsedTestStatus.ERROR))
-    skipped = sum(1 for r in test_results if r.status == ParsedTestStatus.SKIPPED)
+    failed = status_counts[ParsedTestStatus.FAILED] + status_counts[ParsedTestStatus.ERROR]
+    skipped = status_counts[ParsedTestStatus.SKIPPED]
 
     # Calculate pass rate as percentage of all tests (including skipped)
     if total == 0:
@@ -388,17 +395,22 @@ def import_module(
     release_name: str,
     module_name: str,
     logs_base_path: str,
-    skip_existing_jobs: bool = True
+    skip_existing_jobs: bool = True,
+    batch_size: int = IMPORT_COMMIT_BATCH_SIZE
 ) -> Tuple[int, int]:
     """
     Import all jobs for a module from logs directory.
 
+    Commits whenever at least batch_size test results are pending, so a large
+    module does not accumulate in a single transaction or identity map.
+
     Args:
         db: Database session
         release_name: Release name
         module_name: Module name
         logs_base_path: Base path to logs directory
         skip_existing_jobs: Skip jobs that already exist
+        batch_size: Minimum pending test results before committing
 
     Returns:
         Tuple of (jobs imported, total tests imported)
@@ -412,6 +424,7 @@ def import_module(
 
     jobs_imported = 0
     tests_imported = 0
+    pending_tests = 0
 
     # Iterate through job directories
     for job_dir in module_path.iterdir():
@@ -437,8 +450,14 @@ def import_module(
             if test_count > 0:
                 jobs_imported += 1
                 tests_imported += test_count
+                pending_tests += test_count
                 logger.info(f"Imported job {release_name}/{module_name}/{job_id}: {test_count} tests")
 
+            if pending_tests >= batch_size:
+                db.commit()
+                db.expunge_all()
+                pending_tests = 0
+
         except (IntegrityError, SQLAlchemyError) as e:
             logger.error(
                 f"Database error importing job {release_name}/{module_name}/{job_id}: {e}",
@@ -462,7 +481,8 @@ def import_release(
     db: Session,
     release_name: str,
     logs_base_path: str,
-    skip_existing_jobs: bool = True
+    skip_existing_jobs: bool = True,
+    batch_size: int = IMPORT_COMMIT_BATCH_SIZE
 ) -> Tuple[int, int, int]:
     """
     Import all modules and jobs for a release.
@@ -472,6 +492,7 @@ def import_release(
         release_name: Release name
         logs_base_path: Base path to logs directory
         skip_existing_jobs: Skip jobs that already exist
+        batch_size: Minimum pending test results before committing
 
     Returns:
         Tuple of (modules imported, jobs imported, tests imported)
@@ -499,7 +520,8 @@ def import_release(
                 release_name=release_name,
                 module_name=module_name,
                 logs_base_path=logs_base_path,
-                skip_existing_jobs=skip_existing_jobs
+                skip_existing_jobs=skip_existing_jobs,
+                batch_size=batch_size
             )
 
             if jobs > 0:
@@ -527,7 +549,8 @@ def import_release(
 def import_all_logs(
     db: Session,
     logs_base_path: str,
-    skip_existing_jobs: bool = True
+    skip_existing_jobs: bool = True,
+    batch_size: int = IMPORT_COMMIT_BATCH_SIZE
 ) -> Dict[str, Tuple[int, int, int]]:
     """
     Import all releases, modules, and jobs from logs directory.
@@ -536,6 +559,7 @@ def import_all_logs(
         db: Database session
         logs_base_path: Base path to logs directory
         skip_existing_jobs: Skip jobs that already exist
+        batch_size: Minimum pending test results before committing
 
     Returns:
         Dict mapping release_name -> (modules, jobs, tests) imported
@@ -553,7 +577,8 @@ def import_all_logs(
                 db=db,
                 release_name=release_name,
                 logs_base_path=logs_base_path,
-                skip_existing_jobs=skip_existing_jobs
+                skip_existing_jobs=skip_existing_jobs,
+                batch_size=batch_size
             )
 
             results[release_name] = (modules, jobs, tests)
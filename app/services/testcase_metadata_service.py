@@ -217,21 +217,27 @@ def import_testcase_metadata(
     metadata_records = []
     invalid_priority_count = 0
 
-    for _, row in df_filtered.iterrows():
-        testcase_name = str(row['testcase_name']).strip()
+    # Plain tuples over the required columns (all present after validation);
+    # itertuples avoids building a Series per row like iterrows does
+    csv_rows = df_filtered[[
+        'testcase_name', 'test_case_id', 'priority', 'testrail_id', 'component', 'automation_status'
+    ]].itertuples(index=False, name=None)
+
+    for raw_name, test_case_id, raw_priority, testrail_id, component, automation_status in csv_rows:
+        testcase_name = str(raw_name).strip()
 
         # Validate and normalize priority
-        priority_val = _validate_and_normalize_priority(row.get('priority'), testcase_name)
-        if pd.notna(row.get('priority')) and priority_val is None:
+        priority_val = _validate_and_normalize_priority(raw_priority, testcase_name)
+        if pd.notna(raw_priority) and priority_val is None:
             invalid_priority_count += 1
 
         metadata_records.append({
             'testcase_name': testcase_name,
-            'test_case_id': str(row['test_case_id']).strip() if pd.notna(row.get('test_case_id')) else None,
+            'test_case_id': str(test_case_id).strip() if pd.notna(test_case_id) else None,
             'priority': priority_val,
-            'testrail_id': str(row['testrail_id']).strip() if pd.notna(row.get('testrail_id')) else None,
-            'component': str(row['component']).strip() if pd.notna(row.get('component')) else None,
-            'automation_status': str(row['automation_status']).strip() if pd.notna(row.get('automation_status')) else None,
+            'testrail_id': str(testrail_id).strip() if pd.notna(testrail_id) else None,
+            'component': str(component).strip() if pd.notna(component) else None,
+            'automation_status': str(automation_status).strip() if pd.notna(automation_status) else None,
             'updated_at': datetime.now(timezone.utc)
         })
 
@@ -27,10 +27,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import create_engine, func, select, update
 from sqlalchemy.orm import sessionmaker
 from app.models.db_models import Base, TestResult, TestcaseMetadata, Job, Module, Release
 from app.config import get_settings
+from app.database import configure_sqlite_pragmas
 
 import logging
 
@@ -40,6 +41,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max test names per TestcaseMetadata IN (...) lookup
+METADATA_LOOKUP_BATCH_SIZE = 500
+
 
 def backfill_priorities(
     release_name=None,
@@ -60,54 +64,83 @@ def backfill_priorities(
     # Create database connection
     settings = get_settings()
     engine = create_engine(settings.DATABASE_URL)
-    SessionLocal = sessionmaker(bind=engine)
+    if "sqlite" in settings.DATABASE_URL:
+        configure_sqlite_pragmas(engine)
+    # Write-only pass over projected rows: no autoflush or post-commit expiry needed
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     db = SessionLocal()
 
     try:
-        # Build query for test results that need priority updates
-        query = db.query(TestResult).join(
-            Job, TestResult.job_id == Job.id
-        ).join(
-            Module, Job.module_id == Module.id
-        ).join(
-            Release, Module.release_id == Release.id
-        )
-
-        # Apply filters if provided
-        if release_name:
-            query = query.filter(Release.name == release_name)
-            logger.info(f"Filtering by release: {release_name}")
-
-        if job_id:
-            query = query.filter(Job.job_id == job_id)
-            logger.info(f"Filtering by job: {job_id}")
-
-        # Get all test results matching filters
-        test_results = query.all()
-        total = len(test_results)
-
-        logger.info(f"Found {total} test results to process")
-
-        if total == 0:
+        # Build filters for test results that need priority updates
+        filters = []
+
+        # Only touch Job/Module/Release when a filter needs them; the filter is
+        # applied as a job-id subquery so the planner can push the predicate down
+        if release_name or job_id:
+            job_ids = select(Job.id)
+
+            if release_name:
+                job_ids = job_ids.join(
+                    Module, Job.module_id == Module.id
+                ).join(
+                    Release, Module.release_id == Release.id
+                ).where(Release.name == release_name)
+                logger.info(f"Filtering by release: {release_name}")
+
+            if job_id:
+                job_ids = job_ids.where(Job.job_id == job_id)
+                logger.info(f"Filtering by job: {job_id}")
+
+            filters.append(TestResult.job_id.in_(job_ids))
+
+        # Let SQL produce the distinct test names (answered from the
+        # test_name index) before any result rows are materialized
+        raw_names = db.execute(
+            select(TestResult.test_name).distinct().where(*filters)
+        ).scalars().all()
+
+        if not raw_names:
             logger.warning("No test results found matching criteria")
             return 0, 0, 0
 
         # Get unique test names for batch lookup
-        test_names = list(set(tr.test_name for tr in test_results))
+        test_names = list(raw_names)
         logger.info(f"Querying metadata for {len(test_names)} unique test names")
 
         # Build priority lookup from TestcaseMetadata
-        metadata_records = db.query(
-            TestcaseMetadata.testcase_name,
-            TestcaseMetadata.priority
-        ).filter(
-            TestcaseMetadata.testcase_name.in_(test_names)
+        # Chunked to stay under SQLite's bound-parameter limit
+        priority_lookup = {}
+        for offset in range(0, len(test_names), METADATA_LOOKUP_BATCH_SIZE):
+            batch_names = test_names[offset:offset + METADATA_LOOKUP_BATCH_SIZE]
+            metadata_records = db.query(
+                TestcaseMetadata.testcase_name,
+                TestcaseMetadata.priority
+            ).filter(
+                TestcaseMetadata.testcase_name.in_(batch_names)
+            ).all()
+            priority_lookup.update(
+                {record.testcase_name: record.priority for record in metadata_records}
+            )
+        logger.info(f"Found metadata for {len(priority_lookup)} test names")
+
+        if not priority_lookup:
+            total = db.execute(
+                select(func.count(TestResult.id)).where(*filters)
+            ).scalar()
+            logger.warning("No matching metadata found; skipping update pass")
+            return total, 0, total
+
+        # Get all test results matching filters, projecting only the columns
+        # the update pass reads (no ORM hydration)
+        test_results = db.execute(
+            select(TestResult.id, TestResult.test_name, TestResult.priority).where(*filters)
         ).all()
+        total = len(test_results)
 
-        priority_lookup = {record.testcase_name: record.priority for record in metadata_records}
-        logger.info(f"Found metadata for {len(priority_lookup)} test names")
+        logger.info(f"Found {total} test results to process")
 
         # Update test results
+        updates = []
         updated = 0
         not_found = 0
         skipped = 0
@@ -124,10 +157,9 @@ def backfill_priorities(
                             f"{test_result.priority} -> {priority}"
                         )
                     else:
-                        old_priority = test_result.priority
-                        test_result.priority = priority
+                        updates.append({'id': test_result.id, 'priority': priority})
                         logger.debug(
-                            f"Updated {test_result.test_name}: {old_priority} -> {priority}"
+                            f"Updated {test_result.test_name}: {test_result.priority} -> {priority}"
                         )
                     updated += 1
                 else:
@@ -142,6 +174,9 @@ def backfill_priorities(
                     skipped += 1
 
         if not dry_run:
+            # Bulk UPDATE by primary key
+            if updates:
+                db.execute(update(TestResult), updates)
             db.commit()
             logger.info(f"✓ Database committed successfully")
         else:
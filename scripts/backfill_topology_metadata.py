@@ -27,10 +27,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import and_, case, column, create_engine, func, insert, select, table, text
 from sqlalchemy.orm import sessionmaker
 from app.models.db_models import Base, TestResult, TestcaseMetadata, Job, Module, Release
 from app.config import get_settings
+from app.database import configure_sqlite_pragmas
 from app.utils.test_name_utils import normalize_test_name
 
 import logging
@@ -41,6 +42,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# TestcaseMetadata rows fetched per round trip while building the lookup
+METADATA_YIELD_PER = 1000
+
+# Connection-local temp table holding the test_name -> topology lookup
+STAGING_TABLE = 'backfill_topology_lookup'
+
 
 def backfill_topology_metadata(
     release_name=None,
@@ -61,93 +68,130 @@ def backfill_topology_metadata(
     # Create database connection
     settings = get_settings()
     engine = create_engine(settings.DATABASE_URL)
-    SessionLocal = sessionmaker(bind=engine)
+    if "sqlite" in settings.DATABASE_URL:
+        configure_sqlite_pragmas(engine)
+    # Write-only pass over projected rows: no autoflush or post-commit expiry needed
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     db = SessionLocal()
 
     try:
-        # Build query for test results that need topology_metadata updates
-        query = db.query(TestResult).join(
-            Job, TestResult.job_id == Job.id
-        ).join(
-            Module, Job.module_id == Module.id
-        ).join(
-            Release, Module.release_id == Release.id
-        )
-
-        # Apply filters if provided
-        if release_name:
-            query = query.filter(Release.name == release_name)
-            logger.info(f"Filtering by release: {release_name}")
-
-        if job_id:
-            query = query.filter(Job.job_id == job_id)
-            logger.info(f"Filtering by job: {job_id}")
-
-        # Get all test results matching filters
-        test_results = query.all()
-        total = len(test_results)
-
-        logger.info(f"Found {total} test results to process")
-
-        if total == 0:
+        # Build filters for test results that need topology_metadata updates
+        filters = []
+
+        # Only touch Job/Module/Release when a filter needs them; the filter is
+        # applied as a job-id subquery so the planner can push the predicate down
+        if release_name or job_id:
+            job_ids = select(Job.id)
+
+            if release_name:
+                job_ids = job_ids.join(
+                    Module, Job.module_id == Module.id
+                ).join(
+                    Release, Module.release_id == Release.id
+                ).where(Release.name == release_name)
+                logger.info(f"Filtering by release: {release_name}")
+
+            if job_id:
+                job_ids = job_ids.where(Job.job_id == job_id)
+                logger.info(f"Filtering by job: {job_id}")
+
+            filters.append(TestResult.job_id.in_(job_ids))
+
+        # Let SQL produce the distinct test names (answered from the
+        # test_name index) before any result rows are materialized
+        raw_names = db.execute(
+            select(TestResult.test_name).distinct().where(*filters)
+        ).scalars().all()
+
+        if not raw_names:
             logger.warning("No test results found matching criteria")
             return 0, 0, 0
 
-        # Get unique test names for batch lookup (normalize for parameterized tests)
-        test_names = list(set(normalize_test_name(tr.test_name) for tr in test_results))
-        logger.info(f"Querying metadata for {len(test_names)} unique test names")
+        # Normalize each distinct raw name once (parameterized tests share a base name)
+        normalized_names = {
+            raw_name: normalize_test_name(raw_name)
+            for raw_name in raw_names
+        }
 
-        # Build topology lookup from TestcaseMetadata
-        metadata_records = db.query(
-            TestcaseMetadata.testcase_name,
-            TestcaseMetadata.topology
-        ).filter(
-            TestcaseMetadata.testcase_name.in_(test_names)
-        ).all()
+        # Get unique test names for batch lookup
+        test_names = set(normalized_names.values())
+        logger.info(f"Querying metadata for {len(test_names)} unique test names")
 
-        topology_lookup = {record.testcase_name: record.topology for record in metadata_records}
+        # Build topology lookup from TestcaseMetadata by streaming its rows
+        # that have a topology (a small table) and keeping the names needed
+        # here, instead of sending the names back as IN (...) batches
+        topology_lookup = {}
+        for testcase_name, topology in db.execute(
+            select(TestcaseMetadata.testcase_name, TestcaseMetadata.topology).where(
+                TestcaseMetadata.topology.isnot(None)
+            ).execution_options(yield_per=METADATA_YIELD_PER)
+        ):
+            if testcase_name in test_names:
+                topology_lookup[testcase_name] = topology
         logger.info(f"Found metadata for {len(topology_lookup)} test names")
 
-        # Update test results
-        updated = 0
-        not_found = 0
-        skipped = 0
-
-        for test_result in test_results:
-            # Normalize test name for parameterized tests (e.g., test_foo[param] -> test_foo)
-            normalized_name = normalize_test_name(test_result.test_name)
-            topology = topology_lookup.get(normalized_name)
-
-            if topology is not None:
-                # Check if topology_metadata is different
-                if test_result.topology_metadata != topology:
-                    if dry_run:
-                        logger.info(
-                            f"[DRY RUN] Would update {test_result.test_name}: "
-                            f"{test_result.topology_metadata} -> {topology}"
-                        )
-                    else:
-                        old_topology = test_result.topology_metadata
-                        test_result.topology_metadata = topology
-                        logger.debug(
-                            f"Updated {test_result.test_name}: {old_topology} -> {topology}"
-                        )
-                    updated += 1
-                else:
-                    skipped += 1
-            else:
-                # No metadata found for this test
-                if test_result.topology_metadata is None:
-                    logger.debug(f"No metadata found for: {test_result.test_name}")
-                    not_found += 1
-                else:
-                    # Already has topology_metadata and no metadata exists
-                    skipped += 1
+        if not topology_lookup:
+            total = db.execute(
+                select(func.count(TestResult.id)).where(*filters)
+            ).scalar()
+            logger.warning("No matching metadata found; skipping update pass")
+            return total, 0, total
+
+        # Stage raw test_name -> topology once in a temp table so classifying
+        # and updating test results both run as joins inside SQLite instead
+        # of pulling every matching row into Python
+        db.execute(text(
+            f"CREATE TEMP TABLE {STAGING_TABLE} (test_name TEXT PRIMARY KEY, topology TEXT NOT NULL)"
+        ))
+        staged = table(STAGING_TABLE, column('test_name'), column('topology'))
+        db.execute(insert(staged), [
+            {'test_name': raw_name, 'topology': topology_lookup[normalized_name]}
+            for raw_name, normalized_name in normalized_names.items()
+            if normalized_name in topology_lookup
+        ])
+
+        results_table = TestResult.__table__
+        needs_update = and_(
+            staged.c.topology.isnot(None),
+            results_table.c.topology_metadata.is_distinct_from(staged.c.topology)
+        )
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        total, updated, not_found = db.execute(
+            select(
+                func.count(),
+                count_where(needs_update),
+                # No metadata found for this test and nothing set yet
+                count_where(and_(staged.c.topology.is_(None), results_table.c.topology_metadata.is_(None)))
+            ).select_from(
+                results_table.outerjoin(staged, staged.c.test_name == results_table.c.test_name)
+            ).where(*filters)
+        ).one()
+        # Already correct, or already has topology_metadata and no metadata exists
+        skipped = total - updated - not_found
+
+        logger.info(f"Found {total} test results to process")
 
         if not dry_run:
+            # One UPDATE ... FROM join against the staged lookup
+            db.execute(
+                results_table.update().values(topology_metadata=staged.c.topology).where(
+                    results_table.c.test_name == staged.c.test_name, needs_update, *filters
+                )
+            )
+            db.execute(text(f"DROP TABLE {STAGING_TABLE}"))
             db.commit()
             logger.info(f"✓ Database committed successfully")
         else:
+            for test_name, current, topology in db.execute(
+                select(results_table.c.test_name, results_table.c.topology_metadata, staged.c.topology).join(
+                    staged, staged.c.test_name == results_table.c.test_name
+                ).where(needs_update, *filters)
+            ):
+                logger.info(f"[DRY RUN] Would update {test_name}: {current} -> {topology}")
+            db.execute(text(f"DROP TABLE {STAGING_TABLE}"))
             logger.info(f"[DRY RUN] No changes made to database")
 
         # Print summary
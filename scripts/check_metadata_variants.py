@@ -45,34 +45,44 @@ def check_metadata_variants(testcase_name: str):
             print("  3. Test only exists in execution history (no metadata)")
             return
 
-        print(f"Found {len(results)} metadata variant(s):\n")
+        # Build the report in memory and write it once instead of ~15 print()
+        # calls per variant
+        lines = [f"Found {len(results)} metadata variant(s):\n"]
 
         for idx, row in enumerate(results, 1):
             metadata = row.TestcaseMetadata
             release_name = row.release_name or "Global"
 
-            print(f"Variant #{idx}: {release_name}")
-            print(f"  Release ID: {metadata.release_id or 'NULL (Global)'}")
-            print(f"  Test Case ID: {metadata.test_case_id or 'N/A'}")
-            print(f"  TestRail ID: {metadata.testrail_id or 'N/A'}")
-            print(f"  Priority: {metadata.priority or 'N/A'}")
-            print(f"  Topology: {metadata.topology or 'N/A'}")
-            print(f"  Module: {metadata.module or 'N/A'}")
-            print(f"  Test State: {metadata.test_state or 'N/A'}")
-            print(f"  Component: {metadata.component or 'N/A'}")
-            print(f"  Automation Status: {metadata.automation_status or 'N/A'}")
-            print(f"  Is Removed: {metadata.is_removed}")
-            print(f"  Test Path: {metadata.test_path or 'N/A'}")
-            print()
+            lines.extend([
+                f"Variant #{idx}: {release_name}",
+                f"  Release ID: {metadata.release_id or 'NULL (Global)'}",
+                f"  Test Case ID: {metadata.test_case_id or 'N/A'}",
+                f"  TestRail ID: {metadata.testrail_id or 'N/A'}",
+                f"  Priority: {metadata.priority or 'N/A'}",
+                f"  Topology: {metadata.topology or 'N/A'}",
+                f"  Module: {metadata.module or 'N/A'}",
+                f"  Test State: {metadata.test_state or 'N/A'}",
+                f"  Component: {metadata.component or 'N/A'}",
+                f"  Automation Status: {metadata.automation_status or 'N/A'}",
+                f"  Is Removed: {metadata.is_removed}",
+                f"  Test Path: {metadata.test_path or 'N/A'}",
+                "",
+            ])
 
         # Check available releases
-        print(f"\n{'='*80}")
-        print("Available releases in database:")
-        print(f"{'='*80}\n")
-
-        releases = db.query(Release).filter(Release.is_active == True).all()
+        lines.extend([
+            f"\n{'='*80}",
+            "Available releases in database:",
+            f"{'='*80}\n",
+        ])
+
+        releases = db.query(
+            Release.id, Release.name, Release.git_branch
+        ).filter(Release.is_active == True).all()
         for release in releases:
-            print(f"  - {release.name} (ID: {release.id}, Branch: {release.git_branch or 'N/A'})")
+            lines.append(f"  - {release.name} (ID: {release.id}, Branch: {release.git_branch or 'N/A'})")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         print(f"\n{'='*80}")
         print("Summary:")
@@ -22,8 +22,8 @@ import sys
 import argparse
 from pathlib import Path
 from collections import defaultdict
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker, joinedload
+from sqlalchemy import create_engine, func, case, select
+from sqlalchemy.orm import sessionmaker
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,20 +31,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.models.db_models import TestResult, Job, Module, Release
 
 
-def extract_expected_module_from_path(file_path: str) -> str:
-    """
-    Extract the expected module name from a test file path.
+# Path prefix that encodes the owning module: data_plane/tests/{module_name}/...
+MODULE_PATH_PREFIX = 'data_plane/tests/'
+
+# Sample test cases shown per (expected, actual) module pair
+SAMPLES_PER_MISMATCH = 3
+
+# Exclusive upper bound for the prefix range ('0' sorts right after '/')
+MODULE_PATH_PREFIX_END = MODULE_PATH_PREFIX[:-1] + chr(ord('/') + 1)
+
 
-    Assumes pattern: data_plane/tests/{module_name}/...
+def expected_module_sql(file_path_column):
     """
-    if not file_path:
-        return None
+    Create SQL expression extracting the expected module from a test file path.
 
-    parts = file_path.split('/')
-    if len(parts) >= 3 and parts[0] == 'data_plane' and parts[1] == 'tests':
-        return parts[2]
+    Mirrors app.utils.testcase_helpers.extract_module_from_path for paths that
+    start with data_plane/tests/ so mismatches can be grouped server-side:
+    - data_plane/tests/routing/bgp/test.py -> routing
 
-    return None
+    Args:
+        file_path_column: SQLAlchemy column reference (e.g., TestResult.file_path)
+
+    Returns:
+        SQLAlchemy CASE expression yielding the module segment of the path
+    """
+    rest = func.substr(file_path_column, len(MODULE_PATH_PREFIX) + 1)
+    return case(
+        (func.instr(rest, '/') > 0, func.substr(rest, 1, func.instr(rest, '/') - 1)),
+        else_=rest
+    )
 
 
 def main():
@@ -66,8 +81,9 @@ def main():
     Session = sessionmaker(bind=engine)
     session = Session()
 
-    # Get available releases
-    releases = session.query(Release.name).distinct().order_by(Release.name.desc()).all()
+    # Get available releases (names are unique, so no DISTINCT needed; the
+    # descending walk is served by the unique index on releases.name)
+    releases = session.query(Release.name).order_by(Release.name.desc()).all()
     releases = [r[0] for r in releases]
 
     print("🔍 Checking for module cross-contamination...\n")
@@ -93,45 +109,92 @@ def main():
 
     print(f"\n🎯 Analyzing release: {target_release}\n")
 
-    # Query all test results for the target release
-    # Use DISTINCT on file_path + test_name to count unique test cases, not all executions
-    test_results = (
-        session.query(TestResult.file_path, TestResult.test_name, Module.name, Release.name)
+    # Unique test cases (file_path + test_name) per executing module for the
+    # target release, with the expected module derived from the path in SQL
+    unique_tests = (
+        session.query(
+            TestResult.file_path,
+            TestResult.test_name,
+            Module.name.label('actual_module'),
+            expected_module_sql(TestResult.file_path).label('expected_module')
+        )
         .join(Job, TestResult.job_id == Job.id)
         .join(Module, Job.module_id == Module.id)
         .join(Release, Module.release_id == Release.id)
         .filter(
-            TestResult.file_path.like('data_plane/tests/%'),
+            # Half-open range instead of LIKE 'prefix%': SQLite only uses an
+            # index for LIKE with case_sensitive_like, while a range on
+            # file_path can seek idx_test_key (file_path, class_name, test_name)
+            TestResult.file_path >= MODULE_PATH_PREFIX,
+            TestResult.file_path < MODULE_PATH_PREFIX_END,
             Release.name == target_release
         )
-        .distinct()
-        .all()
+        # GROUP BY on the key columns instead of DISTINCT over every projected
+        # column; expected_module is a function of file_path so it adds nothing
+        .group_by(TestResult.file_path, TestResult.test_name, Module.name)
+        .subquery()
     )
 
-    print(f"📊 Total unique test cases with data_plane/tests paths in {target_release}: {len(test_results)}\n")
+    total_unique_tests = session.query(func.count()).select_from(unique_tests).scalar()
 
-    # Track mismatches by expected module and actual module
-    mismatches = defaultdict(lambda: defaultdict(int))
-    mismatch_details = defaultdict(lambda: defaultdict(list))
+    print(f"📊 Total unique test cases with data_plane/tests paths in {target_release}: {total_unique_tests}\n")
 
-    for file_path, test_name, actual_module, release in test_results:
-        expected_module = extract_expected_module_from_path(file_path)
+    # Count mismatches by expected module and actual module server-side
+    mismatch_filter = (
+        unique_tests.c.expected_module != '',
+        unique_tests.c.expected_module != unique_tests.c.actual_module
+    )
+    mismatch_counts = (
+        select(
+            unique_tests.c.expected_module,
+            unique_tests.c.actual_module,
+            func.count()
+        )
+        .where(*mismatch_filter)
+        .group_by(unique_tests.c.expected_module, unique_tests.c.actual_module)
+    )
 
-        if expected_module and expected_module != actual_module:
-            mismatches[expected_module][actual_module] += 1
-            # Store some sample test cases
-            if len(mismatch_details[expected_module][actual_module]) < 5:
-                mismatch_details[expected_module][actual_module].append({
-                    'test_name': test_name,
-                    'file_path': file_path,
-                    'release': release
-                })
+    # Consume plain row tuples straight from the cursor (no Query/ORM layer,
+    # no intermediate list)
+    mismatches = defaultdict(dict)
+    for expected_module, actual_module, count in session.execute(mismatch_counts):
+        mismatches[expected_module][actual_module] = count
 
     if not mismatches:
         print("✅ No cross-contamination detected! All test cases are running in their expected modules.")
         session.close()
         return
 
+    # Fetch the sample test cases for every mismatch pair in one windowed
+    # query, keeping only the first few rows per (expected, actual) pair
+    sample_rank = func.row_number().over(
+        partition_by=(unique_tests.c.expected_module, unique_tests.c.actual_module),
+        order_by=(unique_tests.c.test_name, unique_tests.c.file_path)
+    ).label('sample_rank')
+    ranked_samples = (
+        select(
+            unique_tests.c.expected_module,
+            unique_tests.c.actual_module,
+            unique_tests.c.test_name,
+            unique_tests.c.file_path,
+            sample_rank
+        )
+        .where(*mismatch_filter)
+        .subquery()
+    )
+    mismatch_samples = defaultdict(list)
+    for expected_module, actual_module, test_name, file_path in session.execute(
+        select(
+            ranked_samples.c.expected_module,
+            ranked_samples.c.actual_module,
+            ranked_samples.c.test_name,
+            ranked_samples.c.file_path
+        )
+        .where(ranked_samples.c.sample_rank <= SAMPLES_PER_MISMATCH)
+        .order_by(ranked_samples.c.sample_rank)
+    ):
+        mismatch_samples[(expected_module, actual_module)].append((test_name, file_path))
+
     # Report findings
     print("⚠️  CROSS-CONTAMINATION DETECTED!\n")
     print("=" * 80)
@@ -145,17 +208,16 @@ def main():
             print(f"      - {actual_module}: {count} test cases")
 
             # Show sample test cases
-            samples = mismatch_details[expected_module][actual_module]
-            for sample in samples[:3]:
-                print(f"          • {sample['test_name']}")
-                print(f"            Path: {sample['file_path']}")
-                print(f"            Release: {sample['release']}")
+            samples = mismatch_samples[(expected_module, actual_module)]
+            for test_name, file_path in samples:
+                print(f"          • {test_name}")
+                print(f"            Path: {file_path}")
+                print(f"            Release: {target_release}")
 
     print("\n" + "=" * 80)
     print(f"\n📈 Summary Statistics for {target_release}:")
 
     total_mismatches = sum(sum(modules.values()) for modules in mismatches.values())
-    total_unique_tests = len(test_results)
     print(f"   Total unique test cases analyzed: {total_unique_tests}")
     print(f"   Unique test cases running in wrong modules: {total_mismatches}")
     print(f"   Percentage misplaced: {(total_mismatches/total_unique_tests*100):.1f}%")
@@ -6,7 +6,7 @@ This script identifies and removes duplicate test results, keeping only the
 last instance (highest ID) of each test within a job.
 
 Usage:
-    python scripts/cleanup_duplicates.py [--dry-run]
+    python scripts/cleanup_duplicates.py [--dry-run] [--verify]
 """
 import argparse
 import sys
@@ -18,12 +18,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.database import SessionLocal
 from app.models.db_models import TestResult
-from sqlalchemy import func
+from sqlalchemy import delete, func, select
 
 
-def find_duplicates(db):
-    """Find all duplicate test results."""
-    duplicates = db.query(
+# Max duplicate groups listed in the preview
+PREVIEW_LIMIT = 20
+
+
+def find_duplicates(db, limit=None):
+    """Find duplicate test results (optionally only the first `limit` groups)."""
+    query = db.query(
         TestResult.job_id,
         TestResult.file_path,
         TestResult.class_name,
@@ -34,15 +38,47 @@ def find_duplicates(db):
         TestResult.file_path,
         TestResult.class_name,
         TestResult.test_name
-    ).having(func.count(TestResult.id) > 1).all()
+    ).having(func.count(TestResult.id) > 1)
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query.all()
+
+
+def count_duplicates(db):
+    """
+    Count duplicate groups and the rows that cleanup would remove.
+
+    Returns:
+        Tuple of (duplicate_groups, rows_to_remove)
+    """
+    group_counts = select(
+        func.count(TestResult.id).label('count')
+    ).group_by(
+        TestResult.job_id,
+        TestResult.file_path,
+        TestResult.class_name,
+        TestResult.test_name
+    ).having(func.count(TestResult.id) > 1).subquery()
 
-    return duplicates
+    groups, rows_to_remove = db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(group_counts.c.count - 1), 0)
+        ).select_from(group_counts)
+    ).one()
+
+    return groups, rows_to_remove
 
 
 def cleanup_duplicates(db, dry_run=False):
     """
     Remove duplicate test results, keeping the latest instance.
 
+    All duplicates are removed with a single DELETE that keeps the highest
+    ID per (job_id, file_path, class_name, test_name) group.
+
     Args:
         db: Database session
         dry_run: If True, only report what would be deleted
@@ -50,49 +86,45 @@ def cleanup_duplicates(db, dry_run=False):
     Returns:
         Number of duplicates removed
     """
-    duplicates = find_duplicates(db)
+    groups, rows_to_remove = count_duplicates(db)
 
-    if not duplicates:
+    if not groups:
         print("✓ No duplicates found!")
         return 0
 
-    print(f"\nFound {len(duplicates)} duplicate test cases")
+    print(f"\nFound {groups} duplicate test cases")
     print("=" * 80)
 
-    total_removed = 0
-
-    for dup in duplicates:
-        job_id, file_path, class_name, test_name, count = dup
-
-        # Get all instances of this duplicate, ordered by ID
-        records = db.query(TestResult).filter(
-            TestResult.job_id == job_id,
-            TestResult.file_path == file_path,
-            TestResult.class_name == class_name,
-            TestResult.test_name == test_name
-        ).order_by(TestResult.id).all()
+    # Sample of affected tests for the report
+    for job_id, file_path, class_name, test_name, count in find_duplicates(db, limit=PREVIEW_LIMIT):
+        print(f"\nJob {job_id}: {test_name}")
+        print(f"  Total instances: {count} (keeping highest ID)")
 
-        # Keep the last one (highest ID), delete the rest
-        to_keep = records[-1]
-        to_delete = records[:-1]
+    if groups > PREVIEW_LIMIT:
+        print(f"\n... and {groups - PREVIEW_LIMIT} more duplicate test cases")
 
-        print(f"\nJob {job_id}: {test_name}")
-        print(f"  Total instances: {count}")
-        print(f"  Keeping: ID={to_keep.id}, Status={to_keep.status.value}")
+    if dry_run:
+        print(f"\n[DRY RUN] Would remove {rows_to_remove} duplicate test results")
+        print("Run without --dry-run to actually delete duplicates")
+        return 0
 
-        for i, record in enumerate(to_delete, 1):
-            print(f"  Deleting {i}: ID={record.id}, Status={record.status.value}")
+    keep_ids = select(
+        func.max(TestResult.id)
+    ).group_by(
+        TestResult.job_id,
+        TestResult.file_path,
+        TestResult.class_name,
+        TestResult.test_name
+    )
 
-            if not dry_run:
-                db.delete(record)
-                total_removed += 1
+    result = db.execute(
+        delete(TestResult).where(TestResult.id.not_in(keep_ids)),
+        execution_options={'synchronize_session': False}
+    )
+    db.commit()
 
-    if not dry_run:
-        db.commit()
-        print(f"\n✓ Removed {total_removed} duplicate test results")
-    else:
-        print(f"\n[DRY RUN] Would remove {len(duplicates) * (count - 1)} duplicate test results")
-        print("Run without --dry-run to actually delete duplicates")
+    total_removed = result.rowcount
+    print(f"\n✓ Removed {total_removed} duplicate test results")
 
     return total_removed
 
@@ -107,6 +139,11 @@ def main():
         action="store_true",
         help="Show what would be deleted without actually deleting"
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-scan for duplicates after cleanup (extra full pass over test_results)"
+    )
 
     args = parser.parse_args()
 
@@ -119,11 +156,12 @@ def main():
     try:
         removed = cleanup_duplicates(db, dry_run=args.dry_run)
 
-        if not args.dry_run and removed > 0:
-            # Verify no duplicates remain
-            remaining = find_duplicates(db)
+        # The DELETE's rowcount already reports what was removed; the
+        # re-scan is opt-in since it is another GROUP BY over test_results
+        if args.verify and not args.dry_run and removed > 0:
+            remaining, _ = count_duplicates(db)
             if remaining:
-                print(f"\n⚠ WARNING: {len(remaining)} duplicates still remain!")
+                print(f"\n⚠ WARNING: {remaining} duplicates still remain!")
                 sys.exit(1)
             else:
                 print("\n✓ All duplicates successfully removed!")
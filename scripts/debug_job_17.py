@@ -1,8 +1,9 @@
 
 import sys
 import os
+from collections import defaultdict
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -14,9 +15,35 @@ def debug_job(job_id_display):
     try:
         # Find the job (business_policy, job_id=17 presumably, or similar)
         # We'll search by job_id string
-        jobs = db.query(Job).filter(Job.job_id == str(job_id_display)).all()
+        # Load module and release with the jobs instead of lazily per job
+        jobs = db.query(Job).options(
+            joinedload(Job.module).joinedload(Module.release)
+        ).filter(Job.job_id == str(job_id_display)).all()
         
         print(f"Found {len(jobs)} jobs with ID {job_id_display}")
+
+        job_ids = [job.id for job in jobs]
+
+        # DB Aggregation for all jobs in one pass (served by idx_job_status)
+        status_counts = defaultdict(list)
+        for job_id, status, count in db.query(
+            TestResult.job_id,
+            TestResult.status,
+            func.count(TestResult.id)
+        ).filter(TestResult.job_id.in_(job_ids))\
+         .group_by(TestResult.job_id, TestResult.status).all():
+            status_counts[job_id].append((status, count))
+
+        # Check for duplicates (same test name) across all jobs in one pass
+        duplicates = defaultdict(list)
+        for job_id, name, count in db.query(
+            TestResult.job_id,
+            TestResult.test_name,
+            func.count(TestResult.id)
+        ).filter(TestResult.job_id.in_(job_ids))\
+         .group_by(TestResult.job_id, TestResult.file_path, TestResult.class_name, TestResult.test_name)\
+         .having(func.count(TestResult.id) > 1).all():
+            duplicates[job_id].append((name, count))
         
         for job in jobs:
             print(f"\n--- Job ID: {job.id} (Display ID: {job.job_id}) ---")
@@ -24,27 +51,14 @@ def debug_job(job_id_display):
             print(f"Parent Job ID: {job.parent_job_id}")
             print(f"Job Table Stats -> Total: {job.total}, Passed: {job.passed}, Failed: {job.failed}, Skipped: {job.skipped}, NotRun: {job.not_run}")
             
-            # DB Aggregation
-            stats = db.query(
-                TestResult.status,
-                func.count(TestResult.id)
-            ).filter(TestResult.job_id == job.id).group_by(TestResult.status).all()
-            
             print("TestResult Table Stats:")
             total_rows = 0
-            for status, count in stats:
+            for status, count in status_counts[job.id]:
                 print(f"  {status}: {count}")
                 total_rows += count
             print(f"  TOTAL ROWS: {total_rows}")
-            
-            # Check for duplicates (same test name)
-            dupes = db.query(
-                TestResult.test_name,
-                func.count(TestResult.id)
-            ).filter(TestResult.job_id == job.id)\
-             .group_by(TestResult.file_path, TestResult.class_name, TestResult.test_name)\
-             .having(func.count(TestResult.id) > 1).all()
              
+            dupes = duplicates[job.id]
             if dupes:
                 print(f"WARNING: Found {len(dupes)} duplicate tests!")
                 for name, count in dupes[:5]:
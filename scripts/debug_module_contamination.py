@@ -1,7 +1,8 @@
 import sys
 import os
+from collections import defaultdict
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -17,30 +18,36 @@ def debug_module_view(release_name, module_name, parent_job_id):
         # This matches `get_jobs_for_testcase_module` logic + parent_job_id filter
         job_ids_subquery = db.query(TestResult.job_id).distinct().filter(TestResult.testcase_module == module_name).subquery()
 
-        jobs = db.query(Job).join(Module, Job.module_id == Module.id).filter(
+        # job.module is populated from the existing join instead of lazily per job
+        jobs = db.query(Job).join(Module, Job.module_id == Module.id).options(
+                contains_eager(Job.module)
+            ).filter(
                 Module.release.has(name=release_name),
                 Job.parent_job_id == parent_job_id,
                 Job.id.in_(job_ids_subquery)
             ).all()
             
         print(f"Found {len(jobs)} contributing jobs:")
+
+        # Count tests specifically for this testcase_module, for all jobs in one query
+        status_counts = defaultdict(list)
+        for job_id, status, count in db.query(
+            TestResult.job_id,
+            TestResult.status,
+            func.count(TestResult.id)
+        ).filter(
+            TestResult.job_id.in_([job.id for job in jobs]),
+            TestResult.testcase_module == module_name
+        ).group_by(TestResult.job_id, TestResult.status).all():
+            status_counts[job_id].append((status, count))
         
         grand_total = 0
         
         for job in jobs:
             print(f"\nJob {job.job_id} (Module: {job.module.name}):")
             
-            # Count tests specifically for this testcase_module
-            stats = db.query(
-                TestResult.status,
-                func.count(TestResult.id)
-            ).filter(
-                TestResult.job_id == job.id,
-                TestResult.testcase_module == module_name
-            ).group_by(TestResult.status).all()
-            
             job_total = 0
-            for status, count in stats:
+            for status, count in status_counts[job.id]:
                 print(f"  {status}: {count}")
                 job_total += count
             
@@ -8,7 +8,7 @@ Usage:
 
 This will delete:
 - All jobs with the specified parent_job_id in the release
-- All test results for those jobs (via cascade)
+- All test results for those jobs
 """
 import sys
 import os
@@ -18,12 +18,41 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import argparse
-from sqlalchemy import func
+from collections import defaultdict
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.services import data_service
-from app.models.db_models import Job, TestResult, Module
+from app.models.db_models import Job, Module, Release, TestResult
+
+
+# Max job ids per DELETE ... WHERE id IN (...) statement
+DELETE_BATCH_SIZE = 500
+
+
+def count_test_results_by_module(db: Session, release_name: str, parent_job_id: str):
+    """
+    Count test results per affected module in a single GROUP BY query.
+
+    Args:
+        db: Database session
+        release_name: Release name
+        parent_job_id: Parent job ID
+
+    Returns:
+        Dict mapping module name to test result count
+    """
+    rows = db.query(Module.name, func.count(TestResult.id))\
+        .select_from(Job)\
+        .join(Module, Job.module_id == Module.id)\
+        .join(Release, Module.release_id == Release.id)\
+        .outerjoin(TestResult, TestResult.job_id == Job.id)\
+        .filter(Release.name == release_name, Job.parent_job_id == parent_job_id)\
+        .group_by(Module.name)\
+        .all()
+
+    return {module_name: count for module_name, count in rows}
 
 
 def preview_deletion(db: Session, release_name: str, parent_job_id: str):
@@ -44,18 +73,10 @@ def preview_deletion(db: Session, release_name: str, parent_job_id: str):
     if not jobs:
         return [], 0, set()
 
-    # Count test results that will be deleted
-    job_ids = [job.id for job in jobs]
-    test_results_count = db.query(func.count(TestResult.id))\
-        .filter(TestResult.job_id.in_(job_ids))\
-        .scalar()
-
-    # Get affected modules
-    modules_affected = set()
-    for job in jobs:
-        module = db.query(Module).filter(Module.id == job.module_id).first()
-        if module:
-            modules_affected.add(module.name)
+    # Test result counts and affected modules from one aggregated query
+    module_counts = count_test_results_by_module(db, release_name, parent_job_id)
+    test_results_count = sum(module_counts.values())
+    modules_affected = set(module_counts)
 
     return jobs, test_results_count, modules_affected
 
@@ -78,17 +99,22 @@ def delete_parent_job_data(db: Session, release_name: str, parent_job_id: str):
     if not jobs:
         return 0, 0
 
-    # Count before deletion
+    # Bulk DELETEs by job id instead of per-job db.delete() cascades;
+    # chunked to stay under SQLite's bound-parameter limit
     job_ids = [job.id for job in jobs]
-    test_results_count = db.query(func.count(TestResult.id))\
-        .filter(TestResult.job_id.in_(job_ids))\
-        .scalar()
-
-    jobs_count = len(jobs)
+    test_results_count = 0
+    no_sync = {'synchronize_session': False}
+
+    for offset in range(0, len(job_ids), DELETE_BATCH_SIZE):
+        batch_ids = job_ids[offset:offset + DELETE_BATCH_SIZE]
+        result = db.execute(
+            delete(TestResult).where(TestResult.job_id.in_(batch_ids)),
+            execution_options=no_sync
+        )
+        test_results_count += result.rowcount
+        db.execute(delete(Job).where(Job.id.in_(batch_ids)), execution_options=no_sync)
 
-    # Delete jobs (test_results will be cascade deleted)
-    for job in jobs:
-        db.delete(job)
+    jobs_count = len(job_ids)
 
     db.commit()
 
@@ -153,22 +179,23 @@ def main():
         print(f"  Jobs:         {len(jobs)}")
         print(f"  Test Results: {test_results_count:,}")
         print(f"  Modules:      {len(modules_affected)}")
+        # Group job IDs by module in a single pass
+        job_ids_grouped = defaultdict(list)
+        for job in jobs:
+            job_ids_grouped[job.module.name].append(job.job_id)
+
         print(f"\n  Affected Modules:")
         for module in sorted(modules_affected):
-            module_jobs = [j for j in jobs if db.query(Module).filter(Module.id == j.module_id).first().name == module]
-            print(f"    - {module}: {len(module_jobs)} job(s)")
+            print(f"    - {module}: {len(job_ids_grouped[module])} job(s)")
 
         print(f"\n  Job IDs to be deleted:")
-        job_ids_grouped = {}
-        for job in jobs:
-            module = db.query(Module).filter(Module.id == job.module_id).first()
-            if module.name not in job_ids_grouped:
-                job_ids_grouped[module.name] = []
-            job_ids_grouped[module.name].append(job.job_id)
-
         for module, job_ids in sorted(job_ids_grouped.items()):
             print(f"    {module}: {', '.join(sorted(job_ids, key=lambda x: int(x)))}")
 
+        # End the preview's read transaction so it isn't held open while
+        # waiting on the prompt; the delete re-queries in a fresh one
+        db.rollback()
+
         # Confirm deletion
         if not args.confirm:
             print(f"\n{'='*70}")
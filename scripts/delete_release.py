@@ -10,26 +10,50 @@ Example:
 """
 import sys
 import os
-import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from sqlalchemy import delete, func, select, update
+
 from app.database import get_db_context
-from app.models.db_models import Release, Module, Job, TestResult
+from app.models.db_models import (
+    Release, Module, Job, TestResult, JenkinsPollingLog, TestcaseMetadata
+)
+
+
+# Pages copied per backup step; other connections can run between steps
+BACKUP_PAGES_PER_STEP = 1000
 
 
 def create_backup(db_path: str) -> str:
-    """Create a backup of the database before deletion."""
+    """
+    Create a backup of the database before deletion.
+
+    Uses SQLite's online backup API, which copies a consistent snapshot
+    (including WAL content) in steps, unlike a raw file copy of a live
+    database. The backup is written to a temporary file and renamed into
+    place only once complete.
+    """
     backup_dir = Path(__file__).parent / "data" / "backups"
     backup_dir.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = backup_dir / f"regression_tracker_backup_{timestamp}.db"
+    tmp_path = backup_path.with_name(backup_path.name + ".tmp")
 
-    shutil.copy2(db_path, backup_path)
+    src = sqlite3.connect(str(db_path))
+    dst = sqlite3.connect(str(tmp_path))
+    try:
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP)
+    finally:
+        dst.close()
+        src.close()
+
+    os.replace(tmp_path, backup_path)
     return str(backup_path)
 
 
@@ -40,25 +64,27 @@ def get_deletion_stats(db, release_name: str):
     if not release:
         return None
 
-    # Count modules
-    modules = db.query(Module).filter(Module.release_id == release.id).all()
-    module_count = len(modules)
+    # Module names (column-only query; the count is its length)
+    module_names = [
+        name for (name,) in db.query(Module.name).filter(Module.release_id == release.id).all()
+    ]
 
     # Count jobs
-    jobs = db.query(Job).join(Module).filter(Module.release_id == release.id).all()
-    job_count = len(jobs)
+    job_count = db.query(func.count(Job.id)).join(Module).filter(
+        Module.release_id == release.id
+    ).scalar()
 
     # Count test results
-    test_results_count = db.query(TestResult).join(Job).join(Module).filter(
+    test_results_count = db.query(func.count(TestResult.id)).join(Job).join(Module).filter(
         Module.release_id == release.id
-    ).count()
+    ).scalar()
 
     return {
         'release': release,
-        'modules': module_count,
+        'modules': len(module_names),
         'jobs': job_count,
         'test_results': test_results_count,
-        'module_names': [m.name for m in modules]
+        'module_names': module_names
     }
 
 
@@ -71,6 +97,8 @@ def delete_release(release_name: str, confirm: bool = True):
         print(f"❌ Database not found: {db_path}")
         return False
 
+    # Preview in a short-lived session so no read transaction stays open
+    # while waiting on the confirmation prompt
     with get_db_context() as db:
         # Get deletion stats
         stats = get_deletion_stats(db, release_name)
@@ -79,33 +107,53 @@ def delete_release(release_name: str, confirm: bool = True):
             print(f"❌ Release '{release_name}' not found in database")
             return False
 
-        # Display what will be deleted
-        print("\n" + "="*60)
-        print(f"📊 DELETION SUMMARY for Release: {release_name}")
-        print("="*60)
-        print(f"  Modules:       {stats['modules']} ({', '.join(stats['module_names'])})")
-        print(f"  Jobs:          {stats['jobs']}")
-        print(f"  Test Results:  {stats['test_results']}")
-        print("="*60)
-        print("\n⚠️  This action will CASCADE DELETE all associated data!")
-        print("   (modules, jobs, test_results, MAC addresses, polling logs)\n")
-
-        # Confirm deletion
-        if confirm:
-            response = input("❓ Are you sure you want to delete this release? (yes/no): ")
-            if response.lower() not in ['yes', 'y']:
-                print("❌ Deletion cancelled")
-                return False
-
-        # Create backup
-        print("\n📦 Creating database backup...")
-        backup_path = create_backup(db_path)
-        print(f"✅ Backup created: {backup_path}")
-
-        # Delete the release (CASCADE will delete modules, jobs, test_results)
+        release_id = stats['release'].id
+
+    # Display what will be deleted
+    print("\n" + "="*60)
+    print(f"📊 DELETION SUMMARY for Release: {release_name}")
+    print("="*60)
+    print(f"  Modules:       {stats['modules']} ({', '.join(stats['module_names'])})")
+    print(f"  Jobs:          {stats['jobs']}")
+    print(f"  Test Results:  {stats['test_results']}")
+    print("="*60)
+    print("\n⚠️  This action will CASCADE DELETE all associated data!")
+    print("   (modules, jobs, test_results, MAC addresses, polling logs)\n")
+
+    # Confirm deletion
+    if confirm:
+        response = input("❓ Are you sure you want to delete this release? (yes/no): ")
+        if response.lower() not in ['yes', 'y']:
+            print("❌ Deletion cancelled")
+            return False
+
+    # Create backup
+    print("\n📦 Creating database backup...")
+    backup_path = create_backup(db_path)
+    print(f"✅ Backup created: {backup_path}")
+
+    with get_db_context() as db:
+        # Delete the release with set-based DELETEs instead of db.delete(),
+        # which loads every module/job/test result to cascade in Python.
+        # SQLite runs without PRAGMA foreign_keys, so the schema's
+        # ON DELETE CASCADE never fires: delete children before parents.
         print(f"\n🗑️  Deleting release '{release_name}'...")
-        release = stats['release']
-        db.delete(release)
+        module_ids = select(Module.id).where(Module.release_id == release_id)
+        job_ids = select(Job.id).where(Job.module_id.in_(module_ids))
+        no_sync = {'synchronize_session': False}
+
+        db.execute(delete(TestResult).where(TestResult.job_id.in_(job_ids)), execution_options=no_sync)
+        db.execute(delete(Job).where(Job.module_id.in_(module_ids)), execution_options=no_sync)
+        db.execute(delete(Module).where(Module.release_id == release_id), execution_options=no_sync)
+
+        # Non-cascading relationships: detach like the ORM delete did
+        for model in (JenkinsPollingLog, TestcaseMetadata):
+            db.execute(
+                update(model).where(model.release_id == release_id).values(release_id=None),
+                execution_options=no_sync
+            )
+
+        db.execute(delete(Release).where(Release.id == release_id), execution_options=no_sync)
         db.commit()
 
         print(f"✅ Successfully deleted release '{release_name}' and all associated data")
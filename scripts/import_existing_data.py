@@ -3,7 +3,7 @@
 One-time migration script to import all historical data from logs directory into database.
 
 Usage:
-    python scripts/import_existing_data.py [--logs-path PATH] [--skip-existing]
+    python scripts/import_existing_data.py [--logs-path PATH] [--skip-existing] [--batch-size N]
 
 Examples:
     # Import all logs from default path (../logs)
@@ -16,6 +16,7 @@ Examples:
     python scripts/import_existing_data.py --no-skip-existing
 """
 import sys
+import stat
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -26,7 +27,10 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from app.database import get_db_context
 from app.config import get_settings
-from app.services.import_service import import_all_logs
+from app.services.import_service import import_all_logs, IMPORT_COMMIT_BATCH_SIZE
+
+# Release rows fetched per round trip while syncing last_processed_build
+RELEASE_SYNC_YIELD_PER = 100
 
 
 def main():
@@ -51,6 +55,12 @@ def main():
         action='store_false',
         help='Re-import all jobs even if they exist'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=IMPORT_COMMIT_BATCH_SIZE,
+        help=f'Commit after this many imported test results (default: {IMPORT_COMMIT_BATCH_SIZE})'
+    )
 
     args = parser.parse_args()
 
@@ -66,7 +76,8 @@ def main():
 
     # Path traversal protection: ensure logs path is within allowed directories
     # Allow paths within project directory or sibling directories (common for development)
-    project_parent = SCRIPT_DIR.parent.resolve()
+    # SCRIPT_DIR is already resolved, so its parents need no further resolve()
+    project_parent = SCRIPT_DIR.parent
     try:
         # Check if logs_path is relative to project parent or its siblings
         # This allows ../regression_tracker/logs but prevents /etc/passwd or C:\Windows
@@ -77,12 +88,15 @@ def main():
         print(f"       Project parent: {project_parent.parent}")
         sys.exit(1)
 
-    if not logs_path.exists():
+    # One stat() answers both "exists" and "is a directory"
+    try:
+        logs_path_mode = logs_path.stat().st_mode
+    except FileNotFoundError:
         print(f"ERROR: Logs directory not found: {logs_path}")
         print("Please specify a valid path with --logs-path")
         sys.exit(1)
 
-    if not logs_path.is_dir():
+    if not stat.S_ISDIR(logs_path_mode):
         print(f"ERROR: Logs path is not a directory: {logs_path}")
         sys.exit(1)
 
@@ -98,40 +112,52 @@ def main():
         results = import_all_logs(
             db=db,
             logs_base_path=str(logs_path),
-            skip_existing_jobs=args.skip_existing
+            skip_existing_jobs=args.skip_existing,
+            batch_size=args.batch_size
         )
 
     # Update last_processed_build for all releases after import
     print("\n=== Syncing last_processed_build ===")
     with get_db_context() as db:
         from app.models.db_models import Release, Module, Job
-        from sqlalchemy import func, cast, Integer
+        from sqlalchemy import func, update
+
+        # Max parent_job_id for every release in one grouped query
+        # parent_job_id_int is NULL for NULL/empty parent ids, which MAX ignores
+        max_parent_job_by_release = dict(
+            db.query(
+                Module.release_id,
+                func.max(Job.parent_job_id_int)
+            ).join(
+                Job, Job.module_id == Module.id
+            ).group_by(
+                Module.release_id
+            ).all()
+        )
 
-        releases = db.query(Release).all()
-        updates_made = 0
+        # Stream just the columns the comparison needs instead of loading
+        # every Release entity up front
+        releases = db.query(
+            Release.id, Release.name, Release.last_processed_build
+        ).yield_per(RELEASE_SYNC_YIELD_PER)
+        release_updates = []
 
         for release in releases:
-            # Query max parent_job_id for this release
-            # Filter out NULL and empty values before casting to prevent errors
-            max_parent_job = db.query(
-                func.max(cast(Job.parent_job_id, Integer))
-            ).join(
-                Module
-            ).filter(
-                Module.release_id == release.id,
-                Job.parent_job_id.isnot(None),
-                Job.parent_job_id != ''
-            ).scalar()
+            max_parent_job = max_parent_job_by_release.get(release.id)
 
             if max_parent_job:
                 old_value = release.last_processed_build or 0
                 if max_parent_job != old_value:
-                    release.last_processed_build = max_parent_job
-                    updates_made += 1
+                    release_updates.append({'id': release.id, 'last_processed_build': max_parent_job})
                     print(f"{release.name:15s} {old_value:>6} → {max_parent_job:<6} (updated)")
                 else:
                     print(f"{release.name:15s} {old_value:>6}   (no change)")
 
+        # Bulk UPDATE by primary key
+        if release_updates:
+            db.execute(update(Release), release_updates)
+        updates_made = len(release_updates)
+
         db.commit()
         print(f"Synced {updates_made} release(s)")
 
@@ -141,12 +167,14 @@ def main():
     print("=" * 60)
 
     total_releases = len(results)
-    total_modules = sum(r[0] for r in results.values())
-    total_jobs = sum(r[1] for r in results.values())
-    total_tests = sum(r[2] for r in results.values())
+    total_modules = total_jobs = total_tests = 0
 
+    # Print per-release lines and accumulate totals in the same pass
     for release, (modules, jobs, tests) in results.items():
         print(f"{release:15s} | Modules: {modules:3d} | Jobs: {jobs:4d} | Tests: {tests:7d}")
+        total_modules += modules
+        total_jobs += jobs
+        total_tests += tests
 
     print("=" * 60)
     print(f"Total Releases: {total_releases}")
@@ -12,21 +12,31 @@ This script:
 
 import argparse
 import logging
+import queue
 import sys
+import threading
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 
-import pandas as pd
-from sqlalchemy import create_engine, text, func, case
+from sqlalchemy import (
+    create_engine, text, func, case, bindparam, select, and_, exists, literal, table, column, DateTime
+)
 from sqlalchemy.orm import sessionmaker, Session
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.database import configure_sqlite_pragmas
 from app.models.db_models import TestcaseMetadata, TestResult
 from app.utils.test_name_utils import normalize_test_name
 
+# pandas is imported inside the CSV functions: it is the slowest import here
+# and --help / --only-backfill-results never need it
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,119 +59,289 @@ CSV_TO_DB_MAPPING = {
     'priority': 'priority'                     # Direct mapping
 }
 
+# CSV columns read as pandas categoricals: a handful of distinct values
+# repeated across every row, so they are stored and stripped once per
+# category. Everything else is read as str (see import_from_csv)
+CATEGORICAL_CSV_COLUMNS = ('priority', 'topology', 'test_state', 'module')
+CSV_DTYPES = defaultdict(lambda: str, {column: 'category' for column in CATEGORICAL_CSV_COLUMNS})
+
+# Max test names per TestcaseMetadata IN (...) lookup
+METADATA_LOOKUP_BATCH_SIZE = 500
+
+# Parsed CSV chunks allowed to queue up ahead of the database writer
+CSV_PREFETCH_BATCHES = 4
+
+# Fields always overwritten on existing records (priority is conditional)
+UNCONDITIONAL_UPDATE_FIELDS = (
+    'topology', 'module', 'test_state', 'test_class_name', 'test_path', 'test_case_id'
+)
+
+# Staging table for --staging-merge; rows are bulk-loaded with multi-row
+# INSERTs sized to SQLite's default bound-parameter limit
+STAGING_TABLE = 'stg_testcase_metadata'
+STAGING_COLUMNS = ('testcase_name', 'priority') + UNCONDITIONAL_UPDATE_FIELDS
+SQLITE_MAX_VARIABLES = 999
+
+# test_results.test_name with any parameter suffix stripped, mirroring
+# normalize_test_name() (test_foo[param] -> test_foo) for SQL-side joins
+NORMALIZED_TEST_NAME_SQL = """
+                CASE
+                    WHEN INSTR(test_results.test_name, '[') > 0
+                    THEN SUBSTR(test_results.test_name, 1, INSTR(test_results.test_name, '[') - 1)
+                    ELSE test_results.test_name
+                END"""
+
+
+def detect_csv_encoding(csv_path: Path) -> str:
+    """
+    Determine the CSV encoding, falling back from UTF-8 to latin-1.
+
+    The file is decoded in blocks, so memory use does not grow with file size.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        'utf-8' if the whole file decodes as UTF-8, otherwise 'latin-1'
+    """
+    try:
+        with open(csv_path, encoding='utf-8') as csv_file:
+            while csv_file.read(1024 * 1024):
+                pass
+        logger.info("Successfully read CSV with UTF-8 encoding")
+        return 'utf-8'
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so it always decodes
+        logger.warning("UTF-8 decoding failed, falling back to latin-1 encoding")
+        return 'latin-1'
+
+
+def clean_string_column(df: 'pd.DataFrame', column: str) -> 'pd.Series':
+    """
+    Strip a CSV column's values as strings, mapping missing values to None.
+
+    Args:
+        df: CSV DataFrame
+        column: CSV column name (a missing column yields all None)
+
+    Returns:
+        Object Series of stripped strings or None
+    """
+    import pandas as pd
+
+    if column not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
+
+    values = df[column]
+    return values.astype(str).str.strip().astype(object).where(values.notna(), None)
+
 
-def validate_priority(priority_val: Any, testcase_name: str) -> Optional[str]:
+def validate_priorities(priority_vals: 'pd.Series', testcase_names: 'pd.Series') -> Tuple['pd.Series', int]:
     """
-    Validate and normalize priority value.
+    Validate and normalize a column of priority values.
 
     Args:
-        priority_val: Raw priority value from CSV
-        testcase_name: Test case name for logging
+        priority_vals: Raw priority values from CSV
+        testcase_names: Matching test case names for logging
 
     Returns:
-        Normalized priority string or None if invalid/missing
+        Tuple of (normalized priorities with None for invalid/missing, invalid count)
     """
-    if pd.isna(priority_val) or priority_val == '':
-        return None  # Empty priority (~194 cases in CSV)
+    import pandas as pd
 
-    priority_str = str(priority_val).strip()
+    stripped = priority_vals.astype(str).str.strip()
 
-    if priority_str not in VALID_PRIORITIES:
+    # Categorical conversion maps anything outside VALID_PRIORITIES to NaN
+    # in one vectorized pass
+    categorized = pd.Series(
+        pd.Categorical(stripped, categories=sorted(VALID_PRIORITIES)), index=priority_vals.index
+    )
+    valid = priority_vals.notna() & categorized.notna()
+    invalid = priority_vals.notna() & ~valid
+
+    # Empty priority (~194 cases in CSV) is missing, not invalid, for logging
+    for priority_str, testcase_name in zip(
+        stripped[invalid & (priority_vals != '')], testcase_names[invalid & (priority_vals != '')]
+    ):
         logger.warning(
-            f"Invalid priority '{priority_str}' for test '{testcase_name}'. "
-            f"Expected one of {VALID_PRIORITIES}. Setting to NULL."
+            "Invalid priority '%s' for test '%s'. Expected one of %s. Setting to NULL.",
+            priority_str, testcase_name, VALID_PRIORITIES
         )
-        return None
 
-    return priority_str
+    return categorized.astype(object).where(valid, None), int(invalid.sum())
 
 
-def map_csv_record_to_db(csv_row: pd.Series) -> Dict[str, Any]:
+def map_csv_records_to_db(df: 'pd.DataFrame') -> Tuple[List[Dict[str, Any]], int]:
     """
-    Map CSV row to database record using column mapping.
+    Map CSV rows to database records using column mapping.
+
+    Works column-at-a-time on the DataFrame rather than per row. Rows that
+    repeat a testcase_name collapse into one record carrying the last row's
+    fields and the first valid priority, which is what inserting the first
+    row and applying the rest as updates would produce.
 
     Args:
-        csv_row: Pandas Series from CSV
+        df: CSV DataFrame (rows with testcase_name)
 
     Returns:
-        Dictionary with database column names
+        Tuple of (records with database column names, invalid priority count)
     """
-    testcase_name = str(csv_row['testcase_name']).strip()
-
-    # Map columns
-    db_record = {
-        'testcase_name': testcase_name,
-        'test_case_id': str(csv_row['testcase_id']).strip() if pd.notna(csv_row.get('testcase_id')) else None,
-        'priority': validate_priority(csv_row.get('priority'), testcase_name),
-        'module': str(csv_row['module']).strip() if pd.notna(csv_row.get('module')) else None,
-        'test_state': str(csv_row['test_state']).strip() if pd.notna(csv_row.get('test_state')) else None,
-        'test_class_name': str(csv_row['test_class_name']).strip() if pd.notna(csv_row.get('test_class_name')) else None,
-        'test_path': str(csv_row['path']).strip() if pd.notna(csv_row.get('path')) else None,
-        'topology': str(csv_row['topology']).strip() if pd.notna(csv_row.get('topology')) else None
+    import pandas as pd
+
+    db_columns = {
+        db_col: clean_string_column(df, csv_col)
+        for csv_col, db_col in CSV_TO_DB_MAPPING.items()
+        if csv_col != 'priority'
     }
+    db_columns['testcase_name'] = df['testcase_name'].astype(str).str.strip().astype(object)
+
+    if 'priority' in df.columns:
+        db_columns['priority'], invalid_priority_count = validate_priorities(
+            df['priority'], db_columns['testcase_name']
+        )
+    else:
+        db_columns['priority'], invalid_priority_count = clean_string_column(df, 'priority'), 0
+
+    db_df = pd.DataFrame(db_columns, index=df.index)
 
-    return db_record
+    # Deduplicate by testcase_name so repeated rows cost no extra DB work
+    duplicate_count = int(db_df['testcase_name'].duplicated().sum())
+    if duplicate_count:
+        db_df['priority'] = db_df.groupby('testcase_name', sort=False)['priority'].transform('first')
+        db_df = db_df.drop_duplicates(subset='testcase_name', keep='last')
+        db_df = db_df.astype(object).where(db_df.notna(), None)
+        logger.info(f"Dropped {duplicate_count} duplicate testcase_name rows")
 
+    records = db_df.to_dict(orient='records')
+    return records, invalid_priority_count
 
-def import_record(db: Session, record: Dict[str, Any], dry_run: bool = False) -> str:
+
+def load_existing_metadata(db: Session, testcase_names: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Import or update a single test case record with conditional priority logic.
+    Look up existing metadata rows for a batch of test case names.
 
     Args:
         db: Database session
+        testcase_names: Test case names in the current batch
+
+    Returns:
+        Dictionary mapping testcase_name to its existing row's id, priority
+        and imported fields
+    """
+    existing_map = {}
+    tracked_columns = [
+        getattr(TestcaseMetadata, field) for field in ('id', 'priority') + UNCONDITIONAL_UPDATE_FIELDS
+    ]
+    # Chunked to stay under SQLite's bound-parameter limit
+    for offset in range(0, len(testcase_names), METADATA_LOOKUP_BATCH_SIZE):
+        batch_names = testcase_names[offset:offset + METADATA_LOOKUP_BATCH_SIZE]
+        rows = db.execute(
+            select(TestcaseMetadata.testcase_name, *tracked_columns)
+            .where(TestcaseMetadata.testcase_name.in_(batch_names))
+            .order_by(TestcaseMetadata.id)
+        )
+        for row in rows:
+            # Keep the first row per name, as the old per-row .first() lookup did
+            existing_map.setdefault(row.testcase_name, dict(row._mapping))
+    return existing_map
+
+
+def import_record(
+    record: Dict[str, Any],
+    existing_map: Dict[str, Dict[str, Any]],
+    pending_inserts: Dict[str, Dict[str, Any]],
+    pending_updates: Dict[int, Dict[str, Any]],
+    now: datetime
+) -> Tuple[str, Optional[str]]:
+    """
+    Queue an insert or update for a single test case record with conditional priority logic.
+
+    Nothing is written here: the caller flushes pending_inserts/pending_updates
+    once per batch as table-level Core executemany INSERT/UPDATE statements. A test case
+    repeated within a batch merges into its already-queued write. An existing
+    row whose values would not change is left alone.
+
+    Args:
         record: Database record dictionary
-        dry_run: If True, don't commit changes
+        existing_map: Existing rows per testcase_name, from load_existing_metadata()
+        pending_inserts: Queued new rows for this batch, keyed by testcase_name
+        pending_updates: Queued updates for this batch, keyed by TestcaseMetadata.id
+        now: Timestamp shared by every row written in this batch
 
     Returns:
-        Action taken: 'inserted', 'updated', or 'skipped'
+        Tuple of (action, resulting priority), where action is 'inserted',
+        'updated' or 'unchanged'
     """
-    existing = db.query(TestcaseMetadata).filter(
-        TestcaseMetadata.testcase_name == record['testcase_name']
-    ).first()
-
-    if existing:
-        # EXISTING RECORD - Selective updates
-
-        # Always update these fields (unconditional)
-        existing.topology = record['topology']
-        existing.module = record['module']
-        existing.test_state = record['test_state']
-        existing.test_class_name = record['test_class_name']
-        existing.test_path = record['test_path']
-        existing.test_case_id = record['test_case_id']
-        existing.updated_at = datetime.now(timezone.utc)
-
-        # Conditionally update priority (only if NULL)
-        if existing.priority is None and record['priority'] is not None:
-            existing.priority = record['priority']
-            logger.debug(f"Updated priority: NULL → {record['priority']} for {record['testcase_name']}")
-        elif existing.priority is not None:
-            logger.debug(f"Preserved existing priority: {existing.priority} for {record['testcase_name']}")
+    testcase_name = record['testcase_name']
+    pending = pending_inserts.get(testcase_name)
 
-        if not dry_run:
-            # Changes will be committed in batch
-            pass
+    if pending is None:
+        existing = existing_map.get(testcase_name)
 
-        return 'updated'
-    else:
-        # NEW RECORD - Insert all fields
-        new_metadata = TestcaseMetadata(
-            testcase_name=record['testcase_name'],
-            test_case_id=record['test_case_id'],
-            priority=record['priority'],  # Can be NULL
-            module=record['module'],
-            test_state=record['test_state'],
-            test_class_name=record['test_class_name'],
-            test_path=record['test_path'],
-            topology=record['topology'],
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        if existing is None:
+            # NEW RECORD - Insert all fields
+            pending_inserts[testcase_name] = {**record, 'created_at': now, 'updated_at': now}
+            return 'inserted', record['priority']
 
-        if not dry_run:
-            db.add(new_metadata)
+        pending = pending_updates.get(existing['id'])
 
-        return 'inserted'
+        if pending is None:
+            # Skip the write when neither the imported fields nor the
+            # (NULL-only) priority would change
+            priority = existing['priority'] if existing['priority'] is not None else record['priority']
+            if priority == existing['priority'] and all(
+                record[field] == existing[field] for field in UNCONDITIONAL_UPDATE_FIELDS
+            ):
+                return 'unchanged', priority
+
+            pending = pending_updates[existing['id']] = {
+                'id': existing['id'], 'priority': existing['priority']
+            }
+
+    # EXISTING RECORD - Selective updates
+
+    # Always update these fields (unconditional)
+    for field in UNCONDITIONAL_UPDATE_FIELDS:
+        pending[field] = record[field]
+    pending['updated_at'] = now
+
+    # Conditionally update priority (only if NULL); per-row debug lines use
+    # lazy %-style args so nothing is formatted unless DEBUG is enabled
+    if pending['priority'] is None and record['priority'] is not None:
+        pending['priority'] = record['priority']
+        logger.debug("Updated priority: NULL → %s for %s", record['priority'], testcase_name)
+    elif pending['priority'] is not None:
+        logger.debug("Preserved existing priority: %s for %s", pending['priority'], testcase_name)
+
+    return 'updated', pending['priority']
+
+
+def produce_csv_batches(reader: Iterator['pd.DataFrame'], batch_queue: queue.Queue) -> None:
+    """
+    Parse CSV chunks into database records and hand them to the importer.
+
+    Runs on a background thread. Puts (raw row count, records, invalid
+    priority count) per chunk, the exception if reading fails, and always a
+    final None sentinel.
+
+    Args:
+        reader: Chunked pd.read_csv iterator
+        batch_queue: Queue consumed by import_from_csv
+    """
+    try:
+        for chunk in reader:
+            chunk_rows = len(chunk)
+
+            # Filter for rows with testcase_name
+            chunk = chunk[chunk['testcase_name'].notna() & (chunk['testcase_name'] != '')]
+
+            # Map the chunk's rows to database records in one column-wise pass
+            batch, invalid_priority_count = map_csv_records_to_db(chunk)
+            batch_queue.put((chunk_rows, batch, invalid_priority_count))
+    except Exception as e:
+        batch_queue.put(e)
+    finally:
+        batch_queue.put(None)
 
 
 def import_from_csv(
@@ -182,21 +362,27 @@ def import_from_csv(
     Returns:
         Dictionary with import statistics
     """
+    import pandas as pd
+
     logger.info(f"Reading CSV from {csv_path}")
 
-    # Read CSV with encoding fallback handling
+    # Pick the encoding up front: once chunks are being committed, a decode
+    # error halfway through the file can no longer fall back cleanly
+    encoding = detect_csv_encoding(csv_path)
+
+    # Stream the CSV in batch_size chunks so memory stays flat regardless of
+    # file size. Only mapped columns are parsed; explicit dtypes (str unless
+    # categorical) keep values identical across chunks (per-chunk type
+    # inference would turn an ID column into floats only in chunks that
+    # happen to contain a blank)
     try:
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        logger.info("Successfully read CSV with UTF-8 encoding")
-    except UnicodeDecodeError:
-        logger.warning("UTF-8 decoding failed, trying latin-1 encoding...")
-        try:
-            df = pd.read_csv(csv_path, encoding='latin-1')
-            logger.info("Successfully read CSV with latin-1 encoding")
-        except Exception as e:
-            logger.error(f"Failed to read CSV with both UTF-8 and latin-1 encodings: {e}")
-            logger.error(f"Please check the file encoding at: {csv_path}")
-            raise RuntimeError(f"CSV encoding error: Could not read file with UTF-8 or latin-1") from e
+        reader = pd.read_csv(
+            csv_path,
+            encoding=encoding,
+            usecols=lambda column: column in CSV_TO_DB_MAPPING,
+            dtype=CSV_DTYPES,
+            chunksize=batch_size
+        )
     except FileNotFoundError:
         logger.error(f"CSV file not found: {csv_path}")
         raise
@@ -204,201 +390,405 @@ def import_from_csv(
         logger.error(f"Unexpected error reading CSV: {e}")
         raise
 
-    logger.info(f"Read {len(df)} total rows from CSV")
-
-    # Filter for rows with testcase_name
-    df_filtered = df[df['testcase_name'].notna() & (df['testcase_name'] != '')]
-    logger.info(f"Filtered to {len(df_filtered)} rows with testcase_name")
+    # Table-level Core statements run as executemany, bypassing the ORM bulk
+    # layer. The UPDATE keys on primary key and leaves an existing non-NULL
+    # priority in place via COALESCE
+    metadata_table = TestcaseMetadata.__table__
+    insert_stmt = metadata_table.insert()
+    update_stmt = metadata_table.update().where(
+        metadata_table.c.id == bindparam('b_id')
+    ).values(
+        priority=func.coalesce(metadata_table.c.priority, bindparam('b_priority')),
+        updated_at=bindparam('b_updated_at'),
+        **{field: bindparam(f'b_{field}') for field in UNCONDITIONAL_UPDATE_FIELDS}
+    )
 
     # Statistics counters
     stats = {
         'inserted': 0,
         'updated': 0,
+        'unchanged': 0,
         'skipped': 0,
         'invalid_priority': 0,
         'priority_preserved': 0,
         'priority_updated_from_null': 0,
         'priority_both_null': 0  # Both DB and CSV have NULL priority
     }
+    total_rows = 0
+    processed = 0
+
+    # Parse and map chunks on a background thread so CSV work overlaps the
+    # database writes below; the bounded queue caps how far parsing runs ahead
+    batch_queue = queue.Queue(maxsize=CSV_PREFETCH_BATCHES)
+    threading.Thread(target=produce_csv_batches, args=(reader, batch_queue), daemon=True).start()
+
+    # Process one chunk per batch
+    while True:
+        item = batch_queue.get()
+        if item is None:
+            break
+        if isinstance(item, Exception):
+            raise item
+
+        chunk_rows, batch, invalid_priority_count = item
+        total_rows += chunk_rows
+        stats['invalid_priority'] += invalid_priority_count
+        pending_inserts = {}
+        pending_updates = {}
+        # One clock read per batch; all rows in the batch share the timestamp
+        now = datetime.now(timezone.utc)
+
+        # One IN (...) lookup for the whole batch instead of a SELECT per row
+        existing_map = load_existing_metadata(
+            db, list({db_record['testcase_name'] for db_record in batch})
+        )
 
-    # Process in batches
-    for i in range(0, len(df_filtered), batch_size):
-        batch = df_filtered.iloc[i:i + batch_size]
-
-        for _, row in batch.iterrows():
+        for db_record in batch:
             try:
-                # Map CSV to DB record
-                db_record = map_csv_record_to_db(row)
-
-                # Track priority validation
-                if pd.notna(row.get('priority')) and db_record['priority'] is None:
-                    stats['invalid_priority'] += 1
-
                 # Import record
-                action = import_record(db, db_record, dry_run)
+                action, priority = import_record(db_record, existing_map, pending_inserts, pending_updates, now)
                 stats[action] += 1
 
                 # Track priority updates
                 if action == 'updated':
-                    existing = db.query(TestcaseMetadata).filter(
-                        TestcaseMetadata.testcase_name == db_record['testcase_name']
-                    ).first()
-                    if existing:
-                        if existing.priority == db_record['priority'] and db_record['priority'] is not None:
-                            stats['priority_updated_from_null'] += 1
-                        elif existing.priority is not None and existing.priority != db_record['priority']:
-                            stats['priority_preserved'] += 1
-                        elif existing.priority is None and db_record['priority'] is None:
-                            stats['priority_both_null'] += 1
+                    if priority == db_record['priority'] and db_record['priority'] is not None:
+                        stats['priority_updated_from_null'] += 1
+                    elif priority is not None and priority != db_record['priority']:
+                        stats['priority_preserved'] += 1
+                    elif priority is None and db_record['priority'] is None:
+                        stats['priority_both_null'] += 1
 
             except Exception as e:
-                logger.error(f"Error processing row {row.get('testcase_name')}: {e}")
+                logger.error(f"Error processing row {db_record['testcase_name']}: {e}")
                 stats['skipped'] += 1
 
-        # Commit batch
+        # Write the batch with one executemany INSERT and one executemany
+        # UPDATE; later batches see these rows within the same transaction
         if not dry_run:
-            db.commit()
+            if pending_inserts:
+                db.execute(insert_stmt, list(pending_inserts.values()))
+            if pending_updates:
+                db.execute(update_stmt, [
+                    {f'b_{column}': value for column, value in values.items()}
+                    for values in pending_updates.values()
+                ])
+
+        # Progress update (total row count is unknown while streaming)
+        processed += len(batch)
+        logger.info("Progress: %d rows with testcase_name processed (%d read)", processed, total_rows)
+
+    logger.info(f"Read {total_rows} total rows from CSV, {processed} with testcase_name")
+
+    # Commit the whole import as one transaction (one sync instead of one per batch)
+    if not dry_run:
+        db.commit()
+    logger.info(f"Import completed: {stats}")
+    return stats
 
-        # Progress update
-        progress = min(i + batch_size, len(df_filtered))
-        logger.info(f"Progress: {progress}/{len(df_filtered)} ({progress/len(df_filtered)*100:.1f}%)")
 
+def merge_from_csv_via_staging(db: Session, csv_path: Path, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Import test case metadata from CSV through a staging table and set-based SQL.
+
+    Alternative to import_from_csv(): the cleaned CSV is bulk-loaded into
+    STAGING_TABLE and merged into testcase_metadata with one UPDATE ... FROM
+    and one INSERT ... SELECT, so no Python loop runs per record. Existing
+    rows follow the same rules as import_record(): only the first row (lowest
+    id) per testcase_name is updated, priority is only filled in when NULL,
+    and rows whose values would not change are left alone.
+
+    testcase_name carries no unique constraint, so the merge cannot use
+    INSERT ... ON CONFLICT; updates and inserts are separate statements.
+    The whole CSV is held in memory.
+
+    Args:
+        db: Database session
+        csv_path: Path to CSV file
+        dry_run: If True, compute statistics without writing
+
+    Returns:
+        Dictionary with import statistics (same keys as import_from_csv)
+    """
+    import pandas as pd
+
+    logger.info(f"Reading CSV from {csv_path}")
+
+    try:
+        df = pd.read_csv(
+            csv_path,
+            encoding=detect_csv_encoding(csv_path),
+            usecols=lambda column: column in CSV_TO_DB_MAPPING,
+            dtype=CSV_DTYPES
+        )
+    except FileNotFoundError:
+        logger.error(f"CSV file not found: {csv_path}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error reading CSV: {e}")
+        raise
+
+    total_rows = len(df)
+    df = df[df['testcase_name'].notna() & (df['testcase_name'] != '')]
+
+    # Clean, validate and dedupe across the whole file in one pass
+    records, invalid_priority_count = map_csv_records_to_db(df)
+    logger.info(f"Read {total_rows} total rows from CSV, {len(df)} with testcase_name")
+
+    stats = {
+        'inserted': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'skipped': 0,
+        'invalid_priority': invalid_priority_count,
+        'priority_preserved': 0,
+        'priority_updated_from_null': 0,
+        'priority_both_null': 0
+    }
+    if not records:
+        logger.info(f"Import completed: {stats}")
+        return stats
+
+    pd.DataFrame.from_records(records, columns=list(STAGING_COLUMNS)).to_sql(
+        STAGING_TABLE,
+        db.connection(),
+        if_exists='replace',
+        index=False,
+        method='multi',
+        chunksize=SQLITE_MAX_VARIABLES // len(STAGING_COLUMNS)
+    )
+
+    try:
+        target = TestcaseMetadata.__table__
+        staged = table(STAGING_TABLE, *(column(name) for name in STAGING_COLUMNS))
+
+        # First existing row per testcase_name, matching load_existing_metadata()
+        first_match = target.alias('first_match')
+        target_id = select(func.min(first_match.c.id)).where(
+            first_match.c.testcase_name == staged.c.testcase_name
+        ).scalar_subquery()
+
+        unchanged = and_(
+            func.coalesce(target.c.priority, staged.c.priority).is_not_distinct_from(target.c.priority),
+            *(staged.c[field].is_not_distinct_from(target.c[field]) for field in UNCONDITIONAL_UPDATE_FIELDS)
+        )
+        updated = and_(target.c.id.is_not(None), ~unchanged)
+
+        def count_where(*conditions):
+            return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+        # Classify every staged row with one aggregate over the join, using
+        # the same buckets as the per-row importer
+        row = db.execute(
+            select(
+                count_where(target.c.id.is_(None)).label('inserted'),
+                count_where(updated).label('updated'),
+                count_where(target.c.id.is_not(None), unchanged).label('unchanged'),
+                count_where(
+                    updated,
+                    target.c.priority.is_distinct_from(staged.c.priority),
+                    target.c.priority.is_not(None)
+                ).label('priority_preserved'),
+                count_where(
+                    updated,
+                    staged.c.priority.is_not(None),
+                    func.coalesce(target.c.priority, staged.c.priority) == staged.c.priority
+                ).label('priority_updated_from_null'),
+                count_where(
+                    updated, target.c.priority.is_(None), staged.c.priority.is_(None)
+                ).label('priority_both_null')
+            ).select_from(staged.outerjoin(target, target.c.id == target_id))
+        ).one()
+        stats.update(row._asdict())
+
+        if not dry_run:
+            now = literal(datetime.now(timezone.utc), DateTime())
+
+            db.execute(
+                target.update().where(target.c.id == target_id, ~unchanged).values(
+                    priority=func.coalesce(target.c.priority, staged.c.priority),
+                    updated_at=now,
+                    **{field: staged.c[field] for field in UNCONDITIONAL_UPDATE_FIELDS}
+                )
+            )
+            db.execute(
+                target.insert().from_select(
+                    list(STAGING_COLUMNS) + ['created_at', 'updated_at'],
+                    select(*staged.c, now, now).where(
+                        ~exists().where(target.c.testcase_name == staged.c.testcase_name)
+                    )
+                )
+            )
+    finally:
+        db.execute(text(f"DROP TABLE IF EXISTS {STAGING_TABLE}"))
+
+    if not dry_run:
+        db.commit()
     logger.info(f"Import completed: {stats}")
     return stats
 
 
-def backfill_test_results_topology(db: Session, dry_run: bool = False) -> int:
+def drop_column_indexes(db: Session, table_name: str, column_name: str) -> List[str]:
+    """
+    Drop every index on a table that includes the given column.
+
+    Args:
+        db: Database session
+        table_name: Table whose indexes to inspect
+        column_name: Column the dropped indexes must contain
+
+    Returns:
+        CREATE INDEX statements to restore the dropped indexes
+    """
+    # sql IS NULL marks SQLite's internal autoindexes, which can't be dropped
+    indexes = db.execute(
+        text("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"),
+        {"table": table_name}
+    ).all()
+
+    create_statements = []
+    for index_name, create_sql in indexes:
+        index_columns = [row[2] for row in db.execute(text(f'PRAGMA index_info("{index_name}")'))]
+        if column_name in index_columns:
+            db.execute(text(f'DROP INDEX "{index_name}"'))
+            create_statements.append(create_sql)
+            logger.info(f"Dropped index {index_name} for the backfill")
+
+    return create_statements
+
+
+def recreate_indexes(db: Session, table_name: str, column_name: str, create_statements: List[str]) -> None:
+    """
+    Restore indexes removed by drop_column_indexes() and refresh planner stats.
+
+    Args:
+        db: Database session
+        table_name: Table the indexes belong to
+        column_name: Column the indexes were dropped for (for logging)
+        create_statements: CREATE INDEX statements returned by drop_column_indexes()
+    """
+    if not create_statements:
+        return
+
+    for create_sql in create_statements:
+        db.execute(text(create_sql))
+    db.execute(text(f"ANALYZE {table_name}"))
+    logger.info(f"Recreated {len(create_statements)} index(es) on {table_name}.{column_name}")
+
+
+def backfill_test_results_topology(db: Session, dry_run: bool = False, rebuild_indexes: bool = False) -> int:
     """
     Backfill topology_metadata in test_results from testcase_metadata.
 
     Args:
         db: Database session
         dry_run: If True, preview changes without committing
+        rebuild_indexes: If True, drop indexes on topology_metadata before the
+            UPDATE and recreate them afterwards, instead of maintaining them
+            row by row
 
     Returns:
         Number of test results updated
     """
     logger.info("Starting test_results topology_metadata backfill...")
 
-    # Get all unique test names from metadata for batching
-    metadata_records = db.query(
-        TestcaseMetadata.testcase_name,
-        TestcaseMetadata.topology
-    ).filter(
+    metadata_count = db.query(func.count(TestcaseMetadata.id)).filter(
         TestcaseMetadata.topology.isnot(None)
-    ).all()
+    ).scalar()
+    logger.info(f"Found topology for {metadata_count} test cases in metadata")
+
+    if dry_run:
+        return 0
+
+    # Single correlated UPDATE instead of one statement per topology/name
+    # batch. SQL-side normalization lets test_foo[param] match test_foo in
+    # metadata; the lookups are served by the (testcase_name, priority,
+    # topology) covering index. As in the priority backfill and
+    # load_existing_metadata, the first metadata row by id wins when a name
+    # has several
+    update_sql = text(f"""
+        UPDATE test_results
+        SET topology_metadata = (
+            SELECT tm.topology
+            FROM testcase_metadata tm
+            WHERE tm.testcase_name = {NORMALIZED_TEST_NAME_SQL}
+              AND tm.topology IS NOT NULL
+            ORDER BY tm.id
+            LIMIT 1
+        )
+        WHERE EXISTS (
+            SELECT 1
+            FROM testcase_metadata tm
+            WHERE tm.testcase_name = {NORMALIZED_TEST_NAME_SQL}
+              AND tm.topology IS NOT NULL
+        )
+    """)
+
+    dropped_indexes = drop_column_indexes(db, 'test_results', 'topology_metadata') if rebuild_indexes else []
+
+    result = db.execute(update_sql)
+    updated_count = result.rowcount
+
+    recreate_indexes(db, 'test_results', 'topology_metadata', dropped_indexes)
 
-    # Group test names by their topology value for efficient bulk updates
-    topology_groups = {}
-    for r in metadata_records:
-        if r.topology not in topology_groups:
-            topology_groups[r.topology] = []
-        topology_groups[r.topology].append(r.testcase_name)
-
-    logger.info(f"Found topology for {len(metadata_records)} test cases in metadata")
-    logger.info(f"Grouped into {len(topology_groups)} topology values for bulk updates")
-
-    # Process each topology group with bulk updates using SQL-side normalization
-    batch_size = 5000
-    updated_count = 0
-
-    for topology_value, test_name_list in topology_groups.items():
-        # Process in batches to avoid SQL parameter limits
-        for offset in range(0, len(test_name_list), batch_size):
-            batch_names = test_name_list[offset:offset + batch_size]
-
-            if not dry_run:
-                # Single UPDATE query using SQL-side normalization
-                # This allows test_foo[param] to match test_foo in metadata
-                update_sql = text("""
-                    UPDATE test_results
-                    SET topology_metadata = :topology_value
-                    WHERE CASE
-                            WHEN INSTR(test_name, '[') > 0
-                            THEN SUBSTR(test_name, 1, INSTR(test_name, '[') - 1)
-                            ELSE test_name
-                          END IN :names
-                """)
-
-                result = db.execute(update_sql, {
-                    "topology_value": topology_value,
-                    "names": tuple(batch_names)
-                })
-                updated_count += result.rowcount
-                db.commit()
-
-            # Progress logging
-            if offset % 5000 == 0:
-                logger.info(f"Backfill progress: {updated_count} test results updated so far")
+    db.commit()
 
     logger.info(f"Updated topology_metadata for {updated_count} test results")
     return updated_count
 
 
-def backfill_test_results_priority(db: Session, dry_run: bool = False) -> int:
+def backfill_test_results_priority(db: Session, dry_run: bool = False, rebuild_indexes: bool = False) -> int:
     """
     Backfill priority in test_results from testcase_metadata.
 
     Args:
         db: Database session
         dry_run: If True, preview changes without committing
+        rebuild_indexes: If True, drop indexes on priority before the UPDATE
+            and recreate them afterwards, instead of maintaining them row by row
 
     Returns:
         Number of test results updated
     """
     logger.info("Starting test_results priority backfill...")
 
-    # Get all unique test names from metadata for batching
-    metadata_records = db.query(
-        TestcaseMetadata.testcase_name,
-        TestcaseMetadata.priority
-    ).filter(
+    metadata_count = db.query(func.count(TestcaseMetadata.id)).filter(
         TestcaseMetadata.priority.isnot(None)
-    ).all()
+    ).scalar()
+    logger.info(f"Found priority for {metadata_count} test cases in metadata")
+
+    if dry_run:
+        return 0
+
+    # Single correlated UPDATE, same shape as the topology backfill: the
+    # join runs inside SQLite against the testcase_name index. ONLY update
+    # where priority is currently NULL (preserve existing priorities); the
+    # first metadata row by id wins when a name has several
+    update_sql = text(f"""
+        UPDATE test_results
+        SET priority = (
+            SELECT tm.priority
+            FROM testcase_metadata tm
+            WHERE tm.testcase_name = {NORMALIZED_TEST_NAME_SQL}
+              AND tm.priority IS NOT NULL
+            ORDER BY tm.id
+            LIMIT 1
+        )
+        WHERE priority IS NULL
+          AND EXISTS (
+            SELECT 1
+            FROM testcase_metadata tm
+            WHERE tm.testcase_name = {NORMALIZED_TEST_NAME_SQL}
+              AND tm.priority IS NOT NULL
+        )
+    """)
+
+    dropped_indexes = drop_column_indexes(db, 'test_results', 'priority') if rebuild_indexes else []
+
+    updated_count = db.execute(update_sql).rowcount
 
-    # Group test names by their priority value for efficient bulk updates
-    priority_groups = {}
-    for r in metadata_records:
-        if r.priority not in priority_groups:
-            priority_groups[r.priority] = []
-        priority_groups[r.priority].append(r.testcase_name)
-
-    logger.info(f"Found priority for {len(metadata_records)} test cases in metadata")
-    logger.info(f"Grouped into {len(priority_groups)} priority values for bulk updates")
-
-    # Process each priority group with bulk updates using SQL-side normalization
-    batch_size = 5000
-    updated_count = 0
-
-    for priority_value, test_name_list in priority_groups.items():
-        # Process in batches to avoid SQL parameter limits
-        for offset in range(0, len(test_name_list), batch_size):
-            batch_names = test_name_list[offset:offset + batch_size]
-
-            if not dry_run:
-                # Single UPDATE query using SQL-side normalization
-                # ONLY update where priority is currently NULL (preserve existing priorities)
-                update_sql = text("""
-                    UPDATE test_results
-                    SET priority = :priority_value
-                    WHERE CASE
-                            WHEN INSTR(test_name, '[') > 0
-                            THEN SUBSTR(test_name, 1, INSTR(test_name, '[') - 1)
-                            ELSE test_name
-                          END IN :names
-                    AND priority IS NULL
-                """)
-
-                result = db.execute(update_sql, {
-                    "priority_value": priority_value,
-                    "names": tuple(batch_names)
-                })
-                updated_count += result.rowcount
-                db.commit()
-
-            # Progress logging
-            if offset % 5000 == 0:
-                logger.info(f"Priority backfill progress: {updated_count} test results updated so far")
+    recreate_indexes(db, 'test_results', 'priority', dropped_indexes)
+
+    db.commit()
 
     logger.info(f"Updated priority for {updated_count} test results")
     return updated_count
@@ -430,6 +820,16 @@ def main():
         action='store_true',
         help='Only backfill test_results, skip CSV import'
     )
+    parser.add_argument(
+        '--rebuild-indexes',
+        action='store_true',
+        help='Drop test_results indexes on topology_metadata/priority during the backfill and rebuild them after'
+    )
+    parser.add_argument(
+        '--staging-merge',
+        action='store_true',
+        help='Merge the CSV through a staging table with set-based SQL (loads the whole CSV into memory)'
+    )
     parser.add_argument(
         '--batch-size',
         type=int,
@@ -458,7 +858,9 @@ def main():
 
     # Connect to database
     engine = create_engine(f"sqlite:///{args.database}")
-    Session = sessionmaker(bind=engine)
+    configure_sqlite_pragmas(engine)
+    # Core statements only, no ORM objects to flush or refresh after commit
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     db = Session()
 
     try:
@@ -471,12 +873,19 @@ def main():
             logger.info("PHASE 1: Import from CSV")
             logger.info("=" * 60)
 
-            stats = import_from_csv(
-                db=db,
-                csv_path=args.csv_path,
-                dry_run=args.dry_run,
-                batch_size=args.batch_size
-            )
+            if args.staging_merge:
+                stats = merge_from_csv_via_staging(
+                    db=db,
+                    csv_path=args.csv_path,
+                    dry_run=args.dry_run
+                )
+            else:
+                stats = import_from_csv(
+                    db=db,
+                    csv_path=args.csv_path,
+                    dry_run=args.dry_run,
+                    batch_size=args.batch_size
+                )
 
             logger.info("")
             logger.info("=" * 60)
@@ -484,6 +893,7 @@ def main():
             logger.info("=" * 60)
             logger.info(f"New records inserted:          {stats['inserted']}")
             logger.info(f"Existing records updated:      {stats['updated']}")
+            logger.info(f"Existing records unchanged:    {stats['unchanged']}")
             logger.info(f"Records skipped (errors):      {stats['skipped']}")
             logger.info(f"Invalid priorities (→ NULL):   {stats['invalid_priority']}")
             logger.info(f"Priorities preserved:          {stats['priority_preserved']}")
@@ -502,13 +912,17 @@ def main():
             logger.info("")
             logger.info("Step 2.1: Backfill topology_metadata")
             logger.info("-" * 60)
-            topology_updated_count = backfill_test_results_topology(db=db, dry_run=args.dry_run)
+            topology_updated_count = backfill_test_results_topology(
+                db=db, dry_run=args.dry_run, rebuild_indexes=args.rebuild_indexes
+            )
 
             # Backfill priority
             logger.info("")
             logger.info("Step 2.2: Backfill priority")
             logger.info("-" * 60)
-            priority_updated_count = backfill_test_results_priority(db=db, dry_run=args.dry_run)
+            priority_updated_count = backfill_test_results_priority(
+                db=db, dry_run=args.dry_run, rebuild_indexes=args.rebuild_indexes
+            )
 
             logger.info("")
             logger.info("=" * 60)
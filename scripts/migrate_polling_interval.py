@@ -51,7 +51,12 @@ def migrate_polling_interval():
             return
 
         # Convert minutes to hours
-        interval_minutes = json.loads(old_setting.value)
+        # Settings are JSON-encoded, but a stored number is a plain numeric
+        # string; only fall back to JSON for anything float() rejects
+        try:
+            interval_minutes = float(old_setting.value)
+        except ValueError:
+            interval_minutes = json.loads(old_setting.value)
         interval_hours = interval_minutes / 60.0
 
         print(f"Migrating POLLING_INTERVAL_MINUTES ({interval_minutes} min) → POLLING_INTERVAL_HOURS ({interval_hours} h)")
@@ -16,14 +16,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.database import SessionLocal
 from app.models.db_models import Release, Module, Job
-from sqlalchemy import func, cast, Integer
+from sqlalchemy import func, update
 
 
 def sync_last_processed_builds():
     """Sync last_processed_build for all releases with actual max builds in database."""
     db = SessionLocal()
     try:
-        releases = db.query(Release).all()
+        releases = db.query(Release.id, Release.name, Release.last_processed_build).all()
 
         if not releases:
             print("No releases found in database")
@@ -32,34 +32,41 @@ def sync_last_processed_builds():
         print("Syncing last_processed_build values...")
         print("-" * 60)
 
-        updates_made = 0
+        # Max parent_job_id for every release in one grouped query
+        # parent_job_id_int is the generated integer view of parent_job_id;
+        # NULL/empty parent ids are NULL there and ignored by MAX
+        max_parent_job_by_release = dict(
+            db.query(
+                Module.release_id,
+                func.max(Job.parent_job_id_int)
+            ).join(
+                Job, Job.module_id == Module.id
+            ).group_by(
+                Module.release_id
+            ).all()
+        )
+
+        release_updates = []
 
         for release in releases:
-            # Query max parent_job_id for this release
-            # parent_job_id is stored as String, so we need to cast to Integer
-            # Filter out NULL and empty values before casting to prevent errors
-            max_parent_job = db.query(
-                func.max(cast(Job.parent_job_id, Integer))
-            ).join(
-                Module
-            ).filter(
-                Module.release_id == release.id,
-                Job.parent_job_id.isnot(None),
-                Job.parent_job_id != ''
-            ).scalar()
+            max_parent_job = max_parent_job_by_release.get(release.id)
 
             old_value = release.last_processed_build or 0
 
             if max_parent_job is not None:
                 if max_parent_job != old_value:
-                    release.last_processed_build = max_parent_job
-                    updates_made += 1
+                    release_updates.append({'id': release.id, 'last_processed_build': max_parent_job})
                     print(f"{release.name:15s} {old_value:>6} → {max_parent_job:<6} (updated)")
                 else:
                     print(f"{release.name:15s} {old_value:>6}   (no change)")
             else:
                 print(f"{release.name:15s} {old_value:>6}   (no jobs found)")
 
+        # Bulk UPDATE by primary key
+        if release_updates:
+            db.execute(update(Release), release_updates)
+        updates_made = len(release_updates)
+
         db.commit()
 
         print("-" * 60)
@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """
 Test script to diagnose job import issues with detailed logging and memory tracking.
-Usage: python scripts/test_job_import.py <release> <module> <build_number>
+Usage: python scripts/test_job_import.py <release> <module> <build_number> [--count-lines]
 Example: python scripts/test_job_import.py 7.0 vpn 14
 """
 
 import sys
 import os
 import time
-import tracemalloc
+import resource
 import logging
+import logging.handlers
 from pathlib import Path
 
 # Add project root to path
@@ -20,13 +21,29 @@ from app.database import SessionLocal
 from app.parser.junit_parser import parse_junit_xml
 from app.services.import_service import import_jenkins_job
 
-# Configure detailed logging
+# Bytes read per block when counting artifact lines
+LINE_COUNT_BLOCK_SIZE = 1024 * 1024
+
+# DEBUG records buffered before they are written to the debug log file
+DEBUG_LOG_BUFFER_RECORDS = 10000
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Configure detailed logging. The debug log file sits behind a
+# MemoryHandler so the DEBUG firehose is written in batches rather than
+# one write() per record; ERRORs (and exit) flush it immediately
+debug_file_handler = logging.FileHandler('test_import_debug.log')
+debug_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('test_import_debug.log')
+        logging.handlers.MemoryHandler(
+            DEBUG_LOG_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=debug_file_handler
+        )
     ]
 )
 logger = logging.getLogger(__name__)
@@ -41,39 +58,56 @@ def format_bytes(bytes_val):
     return f"{bytes_val:.2f} TB"
 
 
-def test_artifact_parsing(artifact_path):
+def peak_rss_bytes():
+    """Peak resident set size of this process so far, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux but in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def test_artifact_parsing(artifact_path, count_lines=False):
     """Test parsing XML artifact with memory tracking."""
     logger.info(f"Testing XML parsing: {artifact_path}")
 
-    if not os.path.exists(artifact_path):
+    # One stat() both checks the artifact exists and gets its size
+    try:
+        file_size = os.stat(artifact_path).st_size
+    except FileNotFoundError:
         logger.error(f"Artifact not found: {artifact_path}")
         return None
-
-    # Get file stats
-    file_size = os.path.getsize(artifact_path)
     logger.info(f"File size: {format_bytes(file_size)}")
 
-    with open(artifact_path, 'r') as f:
-        line_count = sum(1 for _ in f)
-    logger.info(f"File lines: {line_count:,}")
-
-    # Start memory tracking
-    tracemalloc.start()
+    # Counting lines is an extra full read of the file before the parse,
+    # so it only runs when asked for (--count-lines)
+    if count_lines:
+        # Count newlines in raw binary blocks instead of decoding the file
+        # into Python line strings; a final line without a trailing newline
+        # still counts
+        line_count = 0
+        last_byte = b"\n"
+        with open(artifact_path, 'rb') as f:
+            for block in iter(lambda: f.read(LINE_COUNT_BLOCK_SIZE), b''):
+                line_count += block.count(b"\n")
+                last_byte = block[-1:]
+        line_count += last_byte != b"\n"
+        logger.info(f"File lines: {line_count:,}")
+
+    # Sample peak RSS instead of tracemalloc, whose per-allocation hook
+    # slows parsing and skews the measured duration
+    rss_before = peak_rss_bytes()
     start_time = time.time()
 
     try:
         logger.info("Starting XML parse...")
         results = parse_junit_xml(artifact_path)
         parse_time = time.time() - start_time
-
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        rss_peak = peak_rss_bytes()
 
         logger.info(f"✓ Parse successful!")
         logger.info(f"  Duration: {parse_time:.2f}s")
         logger.info(f"  Test results: {len(results):,}")
-        logger.info(f"  Memory (current): {format_bytes(current)}")
-        logger.info(f"  Memory (peak): {format_bytes(peak)}")
+        logger.info(f"  Memory (peak RSS): {format_bytes(rss_peak)}")
+        logger.info(f"  Memory (peak RSS growth): {format_bytes(rss_peak - rss_before)}")
         logger.info(f"  Parse rate: {len(results) / parse_time:.0f} tests/sec")
 
         # Show sample results
@@ -85,17 +119,16 @@ def test_artifact_parsing(artifact_path):
 
     except Exception as e:
         parse_time = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        rss_peak = peak_rss_bytes()
 
         logger.error(f"✗ Parse failed after {parse_time:.2f}s")
-        logger.error(f"  Memory at failure (current): {format_bytes(current)}")
-        logger.error(f"  Memory at failure (peak): {format_bytes(peak)}")
+        logger.error(f"  Memory at failure (peak RSS): {format_bytes(rss_peak)}")
+        logger.error(f"  Memory at failure (peak RSS growth): {format_bytes(rss_peak - rss_before)}")
         logger.exception(f"Error: {e}")
         return None
 
 
-def test_job_import(release, module, build_number):
+def test_job_import(release, module, build_number, count_lines=False):
     """Test full job import with database operations."""
     logger.info(f"\n{'='*60}")
     logger.info(f"Testing Import: {release}/{module}/{build_number}")
@@ -119,7 +152,7 @@ def test_job_import(release, module, build_number):
 
     # Step 1: Test parsing only
     logger.info("\n--- Step 1: XML Parsing Test ---")
-    results = test_artifact_parsing(artifact_path)
+    results = test_artifact_parsing(artifact_path, count_lines=count_lines)
     if results is None:
         logger.error("Parsing failed, aborting import test")
         return False
@@ -128,7 +161,7 @@ def test_job_import(release, module, build_number):
     logger.info("\n--- Step 2: Database Import Test ---")
 
     db = SessionLocal()
-    tracemalloc.start()
+    rss_before = peak_rss_bytes()
     start_time = time.time()
 
     try:
@@ -145,26 +178,24 @@ def test_job_import(release, module, build_number):
         )
 
         import_time = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        rss_peak = peak_rss_bytes()
 
         logger.info(f"✓ Import successful!")
         logger.info(f"  Duration: {import_time:.2f}s")
         logger.info(f"  Result: {result}")
-        logger.info(f"  Memory (current): {format_bytes(current)}")
-        logger.info(f"  Memory (peak): {format_bytes(peak)}")
+        logger.info(f"  Memory (peak RSS): {format_bytes(rss_peak)}")
+        logger.info(f"  Memory (peak RSS growth): {format_bytes(rss_peak - rss_before)}")
 
         db.commit()
         return True
 
     except Exception as e:
         import_time = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        rss_peak = peak_rss_bytes()
 
         logger.error(f"✗ Import failed after {import_time:.2f}s")
-        logger.error(f"  Memory at failure (current): {format_bytes(current)}")
-        logger.error(f"  Memory at failure (peak): {format_bytes(peak)}")
+        logger.error(f"  Memory at failure (peak RSS): {format_bytes(rss_peak)}")
+        logger.error(f"  Memory at failure (peak RSS growth): {format_bytes(rss_peak - rss_before)}")
         logger.exception(f"Error: {e}")
 
         db.rollback()
@@ -175,20 +206,22 @@ def test_job_import(release, module, build_number):
 
 
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python scripts/test_job_import.py <release> <module> <build_number>")
+    # Check for --count-lines flag to also report the artifact's line count
+    count_lines = '--count-lines' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--count-lines']
+
+    if len(args) != 3:
+        print("Usage: python scripts/test_job_import.py <release> <module> <build_number> [--count-lines]")
         print("Example: python scripts/test_job_import.py 7.0 vpn 14")
         sys.exit(1)
 
-    release = sys.argv[1]
-    module = sys.argv[2]
-    build_number = sys.argv[3]
+    release, module, build_number = args
 
     logger.info(f"Python version: {sys.version}")
     logger.info(f"Working directory: {os.getcwd()}")
     logger.info(f"Project root: {project_root}")
 
-    success = test_job_import(release, module, build_number)
+    success = test_job_import(release, module, build_number, count_lines=count_lines)
 
     logger.info(f"\n{'='*60}")
     if success:
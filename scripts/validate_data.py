@@ -11,7 +11,9 @@ Usage:
 """
 import argparse
 import json
+import random
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
@@ -19,9 +21,19 @@ from typing import Dict, List, Any, Tuple
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.database import SessionLocal
-from app.models.db_models import Release, Module, Job, TestResult
-from sqlalchemy import func, distinct, text
+from app.database import engine
+from app.models.db_models import Release, Module, Job, TestResult, TestStatusEnum
+from sqlalchemy import func, exists, select, text
+
+
+# Jobs whose stored statistics validate_calculations re-checks
+CALCULATION_SAMPLE_SIZE = 10
+
+# Random job ids probed to fill that sample without sorting the table
+SAMPLE_CANDIDATE_IDS = 50
+
+# Job columns the calculation check compares (plain rows, no ORM instances)
+SAMPLE_JOB_COLUMNS = (Job.id, Job.total, Job.passed, Job.failed, Job.skipped)
 
 
 class DataValidator:
@@ -30,7 +42,9 @@ class DataValidator:
     def __init__(self, verbose: bool = False):
         """Initialize validator."""
         self.verbose = verbose
-        self.db = SessionLocal()
+        # Validation only reads, so use a plain Core connection (rows, no ORM
+        # identity map or unit of work)
+        self.conn = engine.connect()
         self.errors = []
         self.warnings = []
         self.stats = {}
@@ -56,43 +70,55 @@ class DataValidator:
         self.log("Validating data integrity...")
         passed = True
 
-        # Test 1: Check for orphaned modules (modules without a release)
-        orphaned_modules = self.db.query(Module).filter(
-            ~Module.release_id.in_(self.db.query(Release.id))
-        ).count()
-        if orphaned_modules > 0:
-            self.add_error("orphaned_modules", f"Found {orphaned_modules} modules without a valid release")
+        # All checks are scalar subqueries of one SELECT: a single round trip.
+        # Orphan checks use NOT EXISTS anti-joins (one PK probe per row)
+        # rather than NOT IN (SELECT ...); the foreign keys are NOT NULL, so
+        # the results are the same
+        duplicate_release_names = select(Release.name).group_by(
+            Release.name
+        ).having(func.count(Release.id) > 1).subquery()
+
+        counts = self.conn.execute(select(
+            # Test 1: Orphaned modules (modules without a release)
+            select(func.count(Module.id)).where(
+                ~exists().where(Release.id == Module.release_id)
+            ).scalar_subquery().label('orphaned_modules'),
+            # Test 2: Orphaned jobs (jobs without a module)
+            select(func.count(Job.id)).where(
+                ~exists().where(Module.id == Job.module_id)
+            ).scalar_subquery().label('orphaned_jobs'),
+            # Test 3: Orphaned test results (results without a job)
+            select(func.count(TestResult.id)).where(
+                ~exists().where(Job.id == TestResult.job_id)
+            ).scalar_subquery().label('orphaned_results'),
+            # Test 4: Jobs with invalid job IDs (job_id is NOT NULL, so only
+            # empty ones; answered from the idx_job_empty_job_id partial index)
+            select(func.count(Job.id)).where(
+                Job.job_id == ''
+            ).scalar_subquery().label('invalid_jobs'),
+            # Test 5: Duplicate release names
+            select(func.count()).select_from(
+                duplicate_release_names
+            ).scalar_subquery().label('duplicate_releases'),
+        )).one()
+
+        if counts.orphaned_modules > 0:
+            self.add_error("orphaned_modules", f"Found {counts.orphaned_modules} modules without a valid release")
             passed = False
 
-        # Test 2: Check for orphaned jobs (jobs without a module)
-        orphaned_jobs = self.db.query(Job).filter(
-            ~Job.module_id.in_(self.db.query(Module.id))
-        ).count()
-        if orphaned_jobs > 0:
-            self.add_error("orphaned_jobs", f"Found {orphaned_jobs} jobs without a valid module")
+        if counts.orphaned_jobs > 0:
+            self.add_error("orphaned_jobs", f"Found {counts.orphaned_jobs} jobs without a valid module")
             passed = False
 
-        # Test 3: Check for orphaned test results (results without a job)
-        orphaned_results = self.db.query(TestResult).filter(
-            ~TestResult.job_id.in_(self.db.query(Job.id))
-        ).count()
-        if orphaned_results > 0:
-            self.add_error("orphaned_results", f"Found {orphaned_results} test results without a valid job")
+        if counts.orphaned_results > 0:
+            self.add_error("orphaned_results", f"Found {counts.orphaned_results} test results without a valid job")
             passed = False
 
-        # Test 5: Check for duplicate releases
-        duplicate_releases = self.db.query(
-            Release.name, func.count(Release.id).label('count')
-        ).group_by(Release.name).having(func.count(Release.id) > 1).all()
-        if duplicate_releases:
-            self.add_warning("duplicate_releases", f"Found {len(duplicate_releases)} duplicate release names")
-
-        # Test 4: Check for jobs with invalid job IDs
-        invalid_jobs = self.db.query(Job).filter(
-            (Job.job_id == None) | (Job.job_id == '')
-        ).count()
-        if invalid_jobs > 0:
-            self.add_error("invalid_job_ids", f"Found {invalid_jobs} jobs with invalid job IDs")
+        if counts.duplicate_releases:
+            self.add_warning("duplicate_releases", f"Found {counts.duplicate_releases} duplicate release names")
+
+        if counts.invalid_jobs > 0:
+            self.add_error("invalid_job_ids", f"Found {counts.invalid_jobs} jobs with invalid job IDs")
             passed = False
 
         self.log(f"Data integrity validation {'PASSED' if passed else 'FAILED'}")
@@ -103,19 +129,46 @@ class DataValidator:
         self.log("Validating calculations...")
         passed = True
 
-        # Sample 10 random jobs and verify their statistics
-        sample_jobs = self.db.query(Job).order_by(func.random()).limit(10).all()
+        # Sample 10 random jobs and verify their statistics. Probe random
+        # primary keys first instead of sorting the whole jobs table by
+        # random(); fall back to the full sort only when the id range is too
+        # sparse (or too small) to fill the sample
+        sample_jobs = []
+        min_id, max_id = self.conn.execute(select(func.min(Job.id), func.max(Job.id))).one()
+        if min_id is not None:
+            id_range = range(min_id, max_id + 1)
+            candidate_ids = random.sample(id_range, min(SAMPLE_CANDIDATE_IDS, len(id_range)))
+            sample_jobs = self.conn.execute(
+                select(*SAMPLE_JOB_COLUMNS).where(
+                    Job.id.in_(candidate_ids)
+                ).limit(CALCULATION_SAMPLE_SIZE)
+            ).all()
+
+            if len(sample_jobs) < CALCULATION_SAMPLE_SIZE:
+                sample_jobs = self.conn.execute(
+                    select(*SAMPLE_JOB_COLUMNS).order_by(func.random()).limit(CALCULATION_SAMPLE_SIZE)
+                ).all()
+
+        # Count test results per (job, status) for all sampled jobs in one
+        # grouped query instead of loading every result row
+        status_counts = defaultdict(dict)
+        for job_id, status, count in self.conn.execute(
+            select(
+                TestResult.job_id, TestResult.status, func.count(TestResult.id)
+            ).where(
+                TestResult.job_id.in_([job.id for job in sample_jobs])
+            ).group_by(TestResult.job_id, TestResult.status)
+        ):
+            status_counts[job_id][status] = count
 
         for job in sample_jobs:
-            # Get test results for this job
-            results = self.db.query(TestResult).filter(TestResult.job_id == job.id).all()
+            counts = status_counts[job.id]
 
-            # Calculate expected values
-            expected_total = len(results)
-            expected_passed = sum(1 for r in results if r.status.value == 'PASSED')
-            expected_failed = sum(1 for r in results if r.status.value == 'FAILED')
-            expected_skipped = sum(1 for r in results if r.status.value == 'SKIPPED')
-            expected_error = sum(1 for r in results if r.status.value == 'ERROR')
+            # Calculate expected values (Job.failed includes ERROR results)
+            expected_total = sum(counts.values())
+            expected_passed = counts.get(TestStatusEnum.PASSED, 0)
+            expected_failed = counts.get(TestStatusEnum.FAILED, 0) + counts.get(TestStatusEnum.ERROR, 0)
+            expected_skipped = counts.get(TestStatusEnum.SKIPPED, 0)
 
             # Verify totals
             if job.total != expected_total:
@@ -146,13 +199,6 @@ class DataValidator:
                 )
                 passed = False
 
-            if job.error != expected_error:
-                self.add_error(
-                    f"job_{job.id}_error",
-                    f"Job {job.id}: error is {job.error}, expected {expected_error}"
-                )
-                passed = False
-
         self.log(f"Calculation validation {'PASSED' if passed else 'FAILED'}")
         return passed
 
@@ -162,10 +208,12 @@ class DataValidator:
         passed = True
 
         # Test 1: Verify job parent-child relationships are valid
-        jobs_with_invalid_parents = self.db.query(Job).filter(
-            Job.parent_job_id.isnot(None),
-            ~Job.parent_job_id.in_(self.db.query(Job.id))
-        ).count()
+        jobs_with_invalid_parents = self.conn.execute(
+            select(func.count(Job.id)).where(
+                Job.parent_job_id.isnot(None),
+                ~Job.parent_job_id.in_(select(Job.id))
+            )
+        ).scalar()
         if jobs_with_invalid_parents > 0:
             self.add_error(
                 "invalid_parent_jobs",
@@ -174,30 +222,29 @@ class DataValidator:
             passed = False
 
         # Test 2: Verify jobs have reasonable timestamps
-        future_jobs = self.db.query(Job).filter(
-            Job.created_at > datetime.now()
-        ).count()
+        future_jobs = self.conn.execute(
+            select(func.count(Job.id)).where(Job.created_at > datetime.now())
+        ).scalar()
         if future_jobs > 0:
             self.add_warning("future_jobs", f"Found {future_jobs} jobs with future timestamps")
 
         # Test 3: Verify test case uniqueness within jobs
-        duplicate_tests = self.db.query(
-            TestResult.job_id,
-            TestResult.file_path,
-            TestResult.class_name,
-            TestResult.test_name,
-            func.count(TestResult.id).label('count')
-        ).group_by(
+        # Only the number of duplicate groups is reported, so count them in
+        # SQL instead of returning every group's row
+        duplicate_groups = select(TestResult.job_id).group_by(
             TestResult.job_id,
             TestResult.file_path,
             TestResult.class_name,
             TestResult.test_name
-        ).having(func.count(TestResult.id) > 1).all()
+        ).having(func.count(TestResult.id) > 1).subquery()
+        duplicate_tests = self.conn.execute(
+            select(func.count()).select_from(duplicate_groups)
+        ).scalar()
 
         if duplicate_tests:
             self.add_error(
                 "duplicate_test_results",
-                f"Found {len(duplicate_tests)} duplicate test results in jobs"
+                f"Found {duplicate_tests} duplicate test results in jobs"
             )
             passed = False
 
@@ -208,16 +255,30 @@ class DataValidator:
         """Collect database statistics."""
         self.log("Collecting statistics...")
 
+        # Job count and both averages come from a single scan of jobs
+        job_count, avg_tests_per_job, avg_pass_rate = self.conn.execute(
+            select(func.count(Job.id), func.avg(Job.total), func.avg(Job.pass_rate))
+        ).one()
+
+        # The remaining counts are scalar subqueries of one SELECT
+        unique_tests = select(
+            TestResult.file_path + '::' + TestResult.class_name + '::' + TestResult.test_name
+        ).distinct().subquery()
+        counts = self.conn.execute(select(
+            select(func.count()).select_from(Release).scalar_subquery().label('releases'),
+            select(func.count()).select_from(Module).scalar_subquery().label('modules'),
+            select(func.count()).select_from(TestResult).scalar_subquery().label('test_results'),
+            select(func.count()).select_from(unique_tests).scalar_subquery().label('unique_tests'),
+        )).one()
+
         self.stats = {
-            "releases": self.db.query(Release).count(),
-            "modules": self.db.query(Module).count(),
-            "jobs": self.db.query(Job).count(),
-            "test_results": self.db.query(TestResult).count(),
-            "unique_tests": self.db.query(
-                distinct(TestResult.file_path + '::' + TestResult.class_name + '::' + TestResult.test_name)
-            ).count(),
-            "avg_tests_per_job": self.db.query(func.avg(Job.total)).scalar() or 0,
-            "avg_pass_rate": self.db.query(func.avg(Job.pass_rate)).scalar() or 0,
+            "releases": counts.releases,
+            "modules": counts.modules,
+            "jobs": job_count,
+            "test_results": counts.test_results,
+            "unique_tests": counts.unique_tests,
+            "avg_tests_per_job": avg_tests_per_job or 0,
+            "avg_pass_rate": avg_pass_rate or 0,
         }
 
         if self.verbose:
@@ -236,16 +297,18 @@ class DataValidator:
         print("  Regression Tracker - Data Validation")
         print("=" * 60 + "\n")
 
-        self.collect_statistics()
+        # One transaction for every check so they all see the same data
+        with self.conn.begin():
+            self.collect_statistics()
 
-        tests = [
-            self.validate_data_integrity,
-            self.validate_calculations,
-            self.validate_consistency,
-        ]
+            tests = [
+                self.validate_data_integrity,
+                self.validate_calculations,
+                self.validate_consistency,
+            ]
 
-        results = [test() for test in tests]
-        all_passed = all(results)
+            results = [test() for test in tests]
+            all_passed = all(results)
 
         return all_passed
 
@@ -269,7 +332,7 @@ class DataValidator:
 
     def close(self):
         """Close database connection."""
-        self.db.close()
+        self.conn.close()
 
 
 def main():
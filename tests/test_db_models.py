@@ -124,6 +124,39 @@ class TestJob:
         assert len(sample_job.test_results) == 3
 
 
+    def test_parent_job_id_int(self, test_db, sample_module):
+        """Test the generated integer view of parent_job_id."""
+        for job_id, parent_job_id in [("1", "42"), ("2", ""), ("3", None)]:
+            test_db.add(Job(module_id=sample_module.id, job_id=job_id, parent_job_id=parent_job_id))
+        test_db.commit()
+
+        values = dict(test_db.query(Job.job_id, Job.parent_job_id_int).all())
+        assert values == {"1": 42, "2": None, "3": None}
+
+    def test_parent_job_id_int_ddl_postgresql(self):
+        """Test the jobs DDL compiles to a STORED, indexable generated column on PostgreSQL."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex, CreateTable
+
+        ddl = str(CreateTable(Job.__table__).compile(dialect=postgresql.dialect()))
+        assert (
+            "parent_job_id_int INTEGER GENERATED ALWAYS AS "
+            "(CAST(nullif(parent_job_id, '') AS INTEGER)) STORED"
+        ) in ddl
+        assert "VIRTUAL" not in ddl
+
+        index = next(i for i in Job.__table__.indexes if i.name == 'idx_module_parent_job_int')
+        assert "(module_id, parent_job_id_int)" in str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    def test_parent_job_id_int_ddl_mysql(self):
+        """Test the jobs DDL uses MySQL's CAST target for the generated column."""
+        from sqlalchemy.dialects import mysql
+        from sqlalchemy.schema import CreateTable
+
+        ddl = str(CreateTable(Job.__table__).compile(dialect=mysql.dialect()))
+        assert "CAST(nullif(parent_job_id, '') AS SIGNED INTEGER)) STORED" in ddl
+
+
 class TestTestResult:
     """Tests for TestResult model."""
 
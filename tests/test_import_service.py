@@ -4,6 +4,7 @@ Tests for import service.
 import sys
 from pathlib import Path
 import pytest
+from unittest.mock import MagicMock, patch
 
 # Add parent to path
 TESTS_DIR = Path(__file__).resolve().parent
@@ -16,7 +17,8 @@ from app.services.import_service import (
     calculate_job_statistics,
     get_or_create_release,
     get_or_create_module,
-    get_or_create_job
+    get_or_create_job,
+    import_module
 )
 from app.models.db_models import Release, Module, Job, TestStatusEnum
 from app.parser.models import TestStatus as ParsedTestStatus, TestResult as ParsedTestResult
@@ -231,3 +233,29 @@ class TestImportIntegration:
         assert test_db.query(Release).count() == 1
         assert test_db.query(Module).count() == 1
         assert test_db.query(Job).count() == 1
+
+
+class TestImportModuleBatching:
+    """Tests for batched commits in import_module."""
+
+    def test_commits_every_batch(self, tmp_path):
+        """Test that import_module commits once per batch_size pending results."""
+        module_path = tmp_path / "7.0.0.0" / "business_policy"
+        for job_id in ("1", "2", "3", "4"):
+            (module_path / job_id).mkdir(parents=True)
+
+        mock_db = MagicMock()
+        with patch("app.services.import_service.import_job", return_value=(None, 600)):
+            jobs, tests = import_module(
+                db=mock_db,
+                release_name="7.0.0.0",
+                module_name="business_policy",
+                logs_base_path=str(tmp_path),
+                batch_size=1000
+            )
+
+        assert jobs == 4
+        assert tests == 2400
+        # 600 + 600 >= 1000 -> commit, then again after jobs 3 and 4
+        assert mock_db.commit.call_count == 2
+        assert mock_db.expunge_all.call_count == 2
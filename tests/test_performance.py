@@ -51,10 +51,20 @@ class PerformanceMetrics:
 
     def __init__(self):
         self.response_times: List[float] = []
+        self._sorted_times: List[float] = []
 
     def record(self, duration_ms: float):
         """Record a response time."""
         self.response_times.append(duration_ms)
+        self._sorted_times = []
+
+    def _percentile(self, fraction: float) -> float:
+        """Response time at the given fraction, sorting once per batch of records."""
+        if not self.response_times:
+            return 0
+        if not self._sorted_times:
+            self._sorted_times = sorted(self.response_times)
+        return self._sorted_times[int(len(self._sorted_times) * fraction)]
 
     @property
     def min(self) -> float:
@@ -74,20 +84,12 @@ class PerformanceMetrics:
     @property
     def p95(self) -> float:
         """95th percentile response time."""
-        if not self.response_times:
-            return 0
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * 0.95)
-        return sorted_times[index]
+        return self._percentile(0.95)
 
     @property
     def p99(self) -> float:
         """99th percentile response time."""
-        if not self.response_times:
-            return 0
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * 0.99)
-        return sorted_times[index]
+        return self._percentile(0.99)
 
     def print_summary(self, test_name: str):
         """Print performance summary."""
@@ -106,9 +108,9 @@ async def test_homepage_response_time():
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         for _ in range(10):
-            start = time.time()
+            start = time.perf_counter()
             response = await client.get("/")
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
 
             assert response.status_code == 200
@@ -125,9 +127,9 @@ async def test_api_releases_response_time(sample_data):
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         for _ in range(10):
-            start = time.time()
+            start = time.perf_counter()
             response = await client.get("/api/dashboard/releases")
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
 
             assert response.status_code == 200
@@ -164,9 +166,9 @@ async def test_api_job_details_response_time(sample_data):
 
         # Test job details endpoint
         for _ in range(10):
-            start = time.time()
+            start = time.perf_counter()
             response = await client.get(f"/api/jobs/{release_name}/{module_name}/{job_id}")
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
 
             assert response.status_code == 200
@@ -183,9 +185,9 @@ async def test_concurrent_requests():
 
     async def make_request(client: AsyncClient):
         """Make a single request and record timing."""
-        start = time.time()
+        start = time.perf_counter()
         response = await client.get("/api/dashboard/releases")
-        duration_ms = (time.time() - start) * 1000
+        duration_ms = (time.perf_counter() - start) * 1000
         metrics.record(duration_ms)
         return response.status_code
 
@@ -206,16 +208,25 @@ async def test_concurrent_requests():
 async def test_throughput():
     """Test application throughput (requests per second)."""
     num_requests = 100
-    start_time = time.time()
+    # Cap in-flight requests so the run measures the app at a fixed
+    # concurrency rather than the event loop juggling 100 pending requests
+    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+
+    async def make_request(client: AsyncClient):
+        """Make a single request once a concurrency slot is free."""
+        async with semaphore:
+            return await client.get("/api/dashboard/releases")
+
+    start_time = time.perf_counter()
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        tasks = [client.get("/api/dashboard/releases") for _ in range(num_requests)]
+        tasks = [make_request(client) for _ in range(num_requests)]
         responses = await asyncio.gather(*tasks)
 
         # All requests should succeed
         assert all(r.status_code == 200 for r in responses)
 
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     throughput = num_requests / duration
 
     print(f"\nThroughput: {throughput:.2f} req/s ({num_requests} requests in {duration:.2f}s)")
@@ -232,36 +243,36 @@ def test_database_query_performance(sample_data):
 
     try:
         # Test 1: Count all releases
-        start = time.time()
+        start = time.perf_counter()
         release_count = db.query(Release).count()
-        duration_ms = (time.time() - start) * 1000
+        duration_ms = (time.perf_counter() - start) * 1000
         metrics.record(duration_ms)
         print(f"  Release count query: {duration_ms:.2f}ms ({release_count} releases)")
 
         # Test 2: Get all modules for first release
         release = db.query(Release).first()
         if release:
-            start = time.time()
+            start = time.perf_counter()
             modules = db.query(Module).filter(Module.release_id == release.id).all()
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
             print(f"  Module query: {duration_ms:.2f}ms ({len(modules)} modules)")
 
         # Test 3: Get all jobs for first module
         module = db.query(Module).first()
         if module:
-            start = time.time()
+            start = time.perf_counter()
             jobs = db.query(Job).filter(Job.module_id == module.id).all()
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
             print(f"  Job query: {duration_ms:.2f}ms ({len(jobs)} jobs)")
 
         # Test 4: Get all test results for first job
         job = db.query(Job).first()
         if job:
-            start = time.time()
+            start = time.perf_counter()
             results = db.query(TestResult).filter(TestResult.job_id == job.id).all()
-            duration_ms = (time.time() - start) * 1000
+            duration_ms = (time.perf_counter() - start) * 1000
             metrics.record(duration_ms)
             print(f"  Test results query: {duration_ms:.2f}ms ({len(results)} results)")
 
@@ -277,9 +288,9 @@ async def test_large_payload_handling():
     """Test handling of large API responses."""
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         # Request all releases with their modules (potentially large)
-        start = time.time()
+        start = time.perf_counter()
         response = await client.get("/api/dashboard/releases")
-        duration_ms = (time.time() - start) * 1000
+        duration_ms = (time.perf_counter() - start) * 1000
 
         assert response.status_code == 200
         data = response.json()
@@ -493,6 +493,29 @@ class TestAllModulesAggregation:
         assert stats['passed'] == 0
         assert stats['module_count'] == 0
 
+    def test_describe_parent_job(self, test_db, multi_module_jobs):
+        """Test describing a parent job matches the individual lookups."""
+        parent_job_id = multi_module_jobs['parent_job_id_1']
+        description = data_service.describe_parent_job(test_db, "7.0.0.0", parent_job_id)
+
+        assert description['parent_job_url'] == data_service.get_parent_job_url(
+            test_db, "7.0.0.0", parent_job_id
+        )
+        assert description['stats'] == data_service.get_aggregated_stats_for_parent_job(
+            test_db, "7.0.0.0", parent_job_id
+        )
+        assert {job.id for job in description['jobs']} == {
+            job.id for job in data_service.get_jobs_by_parent_job_id(test_db, "7.0.0.0", parent_job_id)
+        }
+
+    def test_describe_parent_job_nonexistent_release(self, test_db):
+        """Test describing a parent job in an unknown release."""
+        description = data_service.describe_parent_job(test_db, "9.9.9.9", "100")
+
+        assert description['parent_job_url'] is None
+        assert description['stats']['module_count'] == 0
+        assert description['jobs'] == []
+
     def test_get_module_breakdown_for_parent_job(self, test_db, multi_module_jobs):
         """Test getting per-module breakdown."""
         from app.models.db_models import TestResult, TestStatusEnum
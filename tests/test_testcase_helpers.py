@@ -5,7 +5,7 @@ Tests the extract_module_from_path function which derives module names
 from test file paths.
 """
 import pytest
-from app.utils.testcase_helpers import extract_module_from_path
+from app.utils.testcase_helpers import extract_module_from_path, extract_modules_bulk
 
 
 class TestExtractModuleFromPath:
@@ -190,3 +190,43 @@ class TestEdgeCases:
         # After split, parts[2] would be empty string
         result = extract_module_from_path(path)
         assert result == "" or result is None
+
+
+class TestExtractModulesBulk:
+    """Tests for extract_modules_bulk function."""
+
+    def test_matches_single_path_extraction(self):
+        """Test that bulk extraction agrees with per-path extraction."""
+        paths = [
+            "data_plane/tests/routing/bgp/test.py",
+            "tests/unit/test.py",
+            None,
+            "",
+            "data_plane/tests",
+            "data_plane/tests/qos/",
+            "/home/user/data_plane/tests/vcmp/test.py",
+        ]
+        assert extract_modules_bulk(paths) == [extract_module_from_path(p) for p in paths]
+
+    def test_preserves_order(self):
+        """Test that results are aligned with input order."""
+        paths = [
+            "data_plane/tests/nvs/test.py",
+            "other/test.py",
+            "data_plane/tests/vpn/test.py",
+        ]
+        assert extract_modules_bulk(paths) == ["nvs", None, "vpn"]
+
+    def test_empty_list(self):
+        """Test that empty input returns empty list."""
+        assert extract_modules_bulk([]) == []
+
+    def test_repeated_paths_use_cache(self):
+        """Test that repeated paths are served from the extraction cache."""
+        extract_module_from_path.cache_clear()
+        paths = ["data_plane/tests/routing/bgp/test.py"] * 5
+
+        assert extract_modules_bulk(paths) == ["routing"] * 5
+        info = extract_module_from_path.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4